@@ -2,12 +2,69 @@ import tkinter as tk
 from tkinter import messagebox
 import threading
 
+class _Toast(tk.Toplevel):
+    """
+    Non-modal, auto-dismissing notification window shown at the bottom-right of the screen.
+    Unlike messagebox, it does not start a nested event loop.
+    """
+
+    MARGIN = 24
+
+    def __init__(self, master, message, duration_ms):
+        super().__init__(master)
+        self.overrideredirect(True)
+        self.attributes("-topmost", True)
+        tk.Label(self, text=message, justify="left", padx=12, pady=8).pack()
+
+        # Place the window at the bottom-right corner of the screen
+        self.update_idletasks()
+        x = self.winfo_screenwidth() - self.winfo_reqwidth() - self.MARGIN
+        y = self.winfo_screenheight() - self.winfo_reqheight() - self.MARGIN
+        self.geometry(f"+{x}+{y}")
+
+        self.after(duration_ms, self.destroy)
+
+
 class PopupManager:
     """
     Manages popup notifications for button clicks and operation completions.
     Can be integrated with any tkinter-based application.
     """
-    
+
+    # Pending notifications are shown together by a single idle callback
+    _pending = []
+    _scheduled = False
+    TOAST_DURATION_MS = 2500
+
+    @staticmethod
+    def _enqueue(message):
+        """
+        Queues a notification and schedules a single idle flush.
+
+        Parameters:
+        - message: Text to show in the toast
+        """
+        root = tk._default_root
+        if root is None:
+            # Without a Tk root no toast can be shown, fall back to a modal box
+            messagebox.showinfo(title="Bilgi", message=message)
+            return
+        PopupManager._pending.append(message)
+        if not PopupManager._scheduled:
+            PopupManager._scheduled = True
+            root.after_idle(PopupManager._flush)
+
+    @staticmethod
+    def _flush():
+        """
+        Drains the pending notifications into one non-modal toast window.
+        """
+        PopupManager._scheduled = False
+        messages, PopupManager._pending = PopupManager._pending, []
+        if not messages:
+            return
+        _Toast(tk._default_root, "\n".join(messages), PopupManager.TOAST_DURATION_MS)
+
     @staticmethod
     def show_start_popup(operation_name):
         """
@@ -16,10 +73,7 @@ class PopupManager:
         Parameters:
         - operation_name: Name of the operation being started
         """
-        messagebox.showinfo(
-            title="İşlem Başlatıldı",
-            message=f"{operation_name} işlemi başlatıldı."
-        )
+        PopupManager._enqueue(f"{operation_name} işlemi başlatıldı.")
     
     @staticmethod
     def show_completion_popup(operation_name, success=True):
@@ -31,10 +85,7 @@ class PopupManager:
         - success: Whether the operation completed successfully
         """
         if success:
-            messagebox.showinfo(
-                title="İşlem Tamamlandı",
-                message=f"{operation_name} işlemi başarıyla tamamlandı."
-            )
+            PopupManager._enqueue(f"{operation_name} işlemi başarıyla tamamlandı.")
         else:
             messagebox.showerror(
                 title="İşlem Başarısız",
@@ -1,12 +1,19 @@
 # Standard Library Imports
 from typing import Union, Optional
 from pathlib import Path
+import functools
+import inspect
+import asyncio
 import logging
 import json
 
+# Third-Party Imports
+import gradio as gr
+
 # Local Application Imports
 from .helpers import (
-    display_dataframe_from_lyrics,
+    display_lines_from_lyrics,
+    lines_from_lyrics,
     load_json_file,
     save_json_file,
     get_font_format,
@@ -14,7 +21,8 @@ from .helpers import (
 from .handlers import handle_audio_processing
 from modules import (
     fetch_and_save_lyrics,
-    perform_lyric_enhancement,
+    update_cached_lyrics,
+    stream_lyric_enhancement,
     process_karaoke_subtitles,
     process_karaoke_video
 )
@@ -23,6 +31,51 @@ from modules import (
 logger = logging.getLogger(__name__)
 
 
+# Helper Decorators
+def run_in_thread(func):
+    """
+    Turns a blocking (network / disk I/O) callback into an `async def` that runs
+    the original function in a worker thread, so Gradio's event loop stays free
+    for other sessions while it waits.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
+
+def with_toasts(func, start_message: str, finish_message: str):
+    """
+    Wraps a callback so the "started" / "finished" Gradio toasts are shown inside
+    the same queued event, instead of as separate `.then()` steps.
+    Works for plain, generator and `async def` callbacks.
+    """
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            gr.Info(start_message)
+            yield from func(*args, **kwargs)
+            gr.Info(finish_message)
+        return generator_wrapper
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            gr.Info(start_message)
+            result = await func(*args, **kwargs)
+            gr.Info(finish_message)
+            return result
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        gr.Info(start_message)
+        result = func(*args, **kwargs)
+        gr.Info(finish_message)
+        return result
+    return wrapper
+
+
 # Callback Functions
 def process_audio_callback(
     audio_file,
@@ -83,7 +136,7 @@ def process_audio_callback(
             return "Error: No raw_lyrics.json found or empty."
 
         # Create display text
-        display_text = display_dataframe_from_lyrics(raw_lyrics_path)
+        display_text = display_lines_from_lyrics(raw_lyrics_path)
 
         # Update State: lyrics, lyrics to display
         state_lyrics_json = raw_lyrics_json
@@ -113,49 +166,54 @@ def modify_lyrics_callback(
     """
     1) Calls AI lyric enhancement using reference_lyrics + raw_lyrics -> modifies time alignment
         Override (Default: True) will force re-run the AI model.
-    2) Updates the states: 
+    2) Streams the states after every AI chunk, finishing with:
         `state_lyrics_json` -> `modified_lyrics.json`, 
         `state_lyrics_display` -> modified display text.
+    The display text is yielded twice so it can also be bound to the lyrics textbox.
     """
     try:
         # Check if working directory is set
         if not state_working_dir:
-            return (state_lyrics_json, "Error: working dir not set")
+            msg = "Error: working dir not set"
+            yield (state_lyrics_json, msg, msg)
+            return
 
         # Process our `raw_lyrics.json` and `reference_lyrics.json` to create
         # a `modified_lyrics.json` which is a corrected and aligned version
         # of the original transcribed `raw_lyrics.json`.
-        # Returns: Path to the modified lyrics file
-        modified_lyrics_path = perform_lyric_enhancement(
+        # Partial results are shown as soon as each chunk comes back from the AI;
+        # the final tuple carries the saved `modified_lyrics.json` content.
+        new_data = None
+        for new_data, _ in stream_lyric_enhancement(
             output_path=state_working_dir,
             override=override,
             file_name="modified_lyrics.json"
-        )
+        ):
+            partial_display = lines_from_lyrics(new_data)
+            yield (state_lyrics_json, partial_display, partial_display)
 
-        # Load the `modified_lyrics.json`
-        new_data = load_json_file(modified_lyrics_path)
         if not new_data:
-            return (state_lyrics_json, "modified_lyrics.json is empty?")
-
-        # Convert modified_lyrics format to a displayed text
-        display_text = display_dataframe_from_lyrics(modified_lyrics_path)
+            msg = "modified_lyrics.json is empty?"
+            yield (state_lyrics_json, msg, msg)
+            return
 
         # Update States: lyrics, lyrics to display
-        state_lyrics_json = new_data
-        state_lyrics_display = display_text
-
-        return (state_lyrics_json, state_lyrics_display)
+        display_text = lines_from_lyrics(new_data)
+        yield (new_data, display_text, display_text)
 
     except Exception as e:
         logger.error(f"Error in modify_lyrics_callback: {e}")
-        return (state_lyrics_json, f"Error: {e}")
+        msg = f"Error: {e}"
+        yield (state_lyrics_json, msg, msg)
 
 
+@run_in_thread
 def fetch_reference_lyrics_callback(
     override,
     state_working_dir,
     state_fetched_lyrics_json,
-    state_fetched_lyrics_display
+    state_fetched_lyrics_display,
+    cache_dir=None
 ):
     """
     1) Runs or loads official lyrics from `reference_lyrics.json`.
@@ -164,18 +222,22 @@ def fetch_reference_lyrics_callback(
     3) Updates the states:
         `state_fetched_lyrics_json` -> `reference_lyrics.json`,
         `state_fetched_lyrics_display` -> official lyrics to display.
+    The display text is returned twice so it can also be bound to the lyrics textbox.
     """
     try:
         # Check if working directory is set
         if not state_working_dir:
-            return (state_fetched_lyrics_json, "Error: working dir not set")
+            msg = "Error: working dir not set"
+            return (state_fetched_lyrics_json, msg, msg)
 
         # Attempt to fetch reference lyrics + save
         # (this will skip if `reference_lyrics.json` already exists, unless override).
+        # (Lyrics of the same song are also shared across working dirs via `cache_dir`.)
         fetch_and_save_lyrics(
             state_working_dir,
             override=override,
-            file_name="reference_lyrics.json"
+            file_name="reference_lyrics.json",
+            cache_dir=cache_dir
         )
 
         # Path to reference_lyrics.json
@@ -186,7 +248,8 @@ def fetch_reference_lyrics_callback(
 
         # Check if the file is empty or not found
         if not lyrics_data:
-            return (None, "No official lyrics found or empty after fetch.")
+            msg = "No official lyrics found or empty after fetch."
+            return (None, msg, msg)
 
         # If official lyrics are a list of strings (each item is one verse).
         # Join them into multiline string for editing
@@ -200,21 +263,25 @@ def fetch_reference_lyrics_callback(
         state_fetched_lyrics_json = lyrics_data
         state_fetched_lyrics_display = display_text
 
-        return (state_fetched_lyrics_json, state_fetched_lyrics_display)
+        return (state_fetched_lyrics_json, state_fetched_lyrics_display, state_fetched_lyrics_display)
 
     except Exception as e:
         logger.error(f"Error in fetch_reference_lyrics_callback: {e}")
-        return (state_fetched_lyrics_json, f"Error: {e}")
+        msg = f"Error: {e}"
+        return (state_fetched_lyrics_json, msg, msg)
 
 
+@run_in_thread
 def save_fetched_lyrics_callback(
     fetched_lyrics_str,
     state_working_dir,
     state_fetched_lyrics_json,
-    state_fetched_lyrics_display
+    state_fetched_lyrics_display,
+    cache_dir=None
 ):
     """
     1) Takes user-edited text from the right textbox, splits into lines, and overwrites reference_lyrics.json
+       (and the shared lyrics cache entry for the song, if `cache_dir` is given)
     2) Updates the states:
         `state_fetched_lyrics_json` -> list of lines, 
         `state_fetched_lyrics_display` -> user-edited text.
@@ -234,6 +301,12 @@ def save_fetched_lyrics_callback(
         # Overwrite reference_lyrics.json with the new lines
         save_json_file(new_lines, ref_lyrics_path)
 
+        # Keep the shared lyrics cache in sync, so a later fetch does not return the pre-edit copy
+        try:
+            update_cached_lyrics(state_working_dir, new_lines, cache_dir)
+        except Exception as e:
+            logger.warning(f"Could not update cached lyrics: {e}")
+
         # Update the states: fetched lyrics, fetched lyrics to display
         state_fetched_lyrics_json = new_lines
         state_fetched_lyrics_display = fetched_lyrics_str
@@ -244,6 +317,7 @@ def save_fetched_lyrics_callback(
         logger.error(f"Error in save_fetched_lyrics_callback: {e}")
         return (state_fetched_lyrics_json, f"Error: {e}")
 
+@run_in_thread
 def save_metadata_callback(state_working_dir, artist_name, song_name):
     """
     Updates the metadata.json with the artist name and song name.
@@ -1,33 +1,51 @@
 """
 Şarkı sözleri için zaman düzenleme bileşeni
 """
-import gradio as gr
-import pandas as pd
+import numpy as np
 import json
 import logging
+import os
 import re
+import shutil
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
-def parse_ass_time(time_str):
+# ASS metnindeki yeni satır (\N) ve stil komutlarını ({...}) tek geçişte bulan desen
+_ASS_STRIP = re.compile(r'\\N|\{[^}]*\}')
+
+# Son oluşturulan tablolar (LRU): (çalışma dizini, ass_mtime, lyrics parmak izi) -> DataFrame
+_DF_CACHE_SIZE = 16
+_df_cache = OrderedDict()
+
+def _lyrics_fingerprint(lyrics_json):
     """
-    ASS zaman formatını (0:00:00.00) saniyeye çevirir
+    lyrics JSON verisinin içerik özetini döndürür (nesne kimliği yerine içerikle eşleşir)
     
     Args:
-        time_str (str): ASS zaman formatı
+        lyrics_json: Şarkı sözlerinin JSON verisi
         
     Returns:
-        float: Saniye cinsinden zaman
+        str: İçeriğin blake2b özeti
     """
-    try:
-        h, m, s = time_str.split(':')
-        return int(h) * 3600 + int(m) * 60 + float(s)
-    except Exception as e:
-        logger.error(f"Zaman formatı çevrilemedi: {time_str}, hata: {e}")
-        return 0.0
+    data = json.dumps(lyrics_json, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+def _invalidate_df_cache(working_dir):
+    """Verilen çalışma dizinine ait tüm önbellek kayıtlarını siler."""
+    working_dir = str(working_dir)
+    for key in [key for key in _df_cache if key[0] == working_dir]:
+        del _df_cache[key]
 
+def _ass_strip_repl(match):
+    """\\N yerine boşluk koyar, stil komutlarını siler."""
+    return ' ' if match.group(0) == '\\N' else ''
+
+@lru_cache(maxsize=8192)
 def seconds_to_ass_time(seconds):
     """
     Saniyeyi ASS zaman formatına (0:00:00.00) çevirir
@@ -39,9 +57,8 @@ def seconds_to_ass_time(seconds):
         str: ASS zaman formatı
     """
     try:
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        s = seconds % 60
+        m_total, s = divmod(seconds, 60)
+        h, m = divmod(int(m_total), 60)
         return f"{h}:{m:02d}:{s:05.2f}"
     except Exception as e:
         logger.error(f"Saniye formatı çevrilemedi: {seconds}, hata: {e}")
@@ -76,124 +93,137 @@ def write_ass_file(file_path, lines):
         bool: Başarılı ise True
     """
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+        # Tek bir tampon halinde, tek write çağrısıyla yaz
+        data = ''.join(lines)
+        with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(data)
         return True
     except Exception as e:
         logger.error(f"ASS dosyası yazma hatası: {e}")
         return False
 
-def extract_dialogue_lines(ass_file_path):
+def extract_dialogue_lines(source):
     """
     ASS dosyasından Dialogue satırlarını çıkarır
     
     Args:
-        ass_file_path (str): ASS dosyasının yolu
+        source (str | Path | list): ASS dosyasının yolu ya da önceden okunmuş satırlar
         
     Returns:
         list: Dialogue satırları ve indeksleri [(index, satır), ...]
     """
     try:
-        lines = read_ass_file(ass_file_path)
-        dialogue_lines = []
-        
-        for i, line in enumerate(lines):
-            if line.startswith('Dialogue:'):
-                dialogue_lines.append((i, line))
-                
-        return dialogue_lines
+        # Satırlar zaten okunduysa dosyayı yeniden açma
+        lines = read_ass_file(source) if isinstance(source, (str, Path)) else source
+
+        # [Script Info] / [V4+ Styles] başlığını atla, yalnızca [Events] bölümünü tara
+        events_start = next((i for i, line in enumerate(lines) if line.startswith('[Events]')), 0)
+        startswith = str.startswith
+        return [
+            (i, line) for i, line in enumerate(lines[events_start:], events_start)
+            if startswith(line, 'Dialogue:')
+        ]
     except Exception as e:
         logger.error(f"Dialogue satırları çıkarılamadı: {e}")
         return []
 
-def create_lyrics_timing_editor(working_dir, lyrics_json):
+def _rewrite_ass_times(line, start_time, end_time):
     """
-    Şarkı sözleri için zaman düzenleme bileşenini oluşturur
+    Dialogue satırındaki başlangıç ve bitiş alanlarını, satırın geri kalanını
+    bölmeden değiştirir
     
     Args:
-        working_dir: Çalışma dizini
-        lyrics_json: Şarkı sözlerinin JSON verisi
+        line (str): Dialogue satırı
+        start_time (str): Yeni başlangıç zamanı (ASS formatı)
+        end_time (str): Yeni bitiş zamanı (ASS formatı)
         
     Returns:
-        tuple: (lyrics_df, save_button)
+        str: Güncellenmiş satır
     """
-    if not working_dir:
-        # Eğer working_dir yoksa boş bir dataframe döndür
-        empty_df = pd.DataFrame({
-            "Sıra": [], 
-            "Başlangıç (sn)": [], 
-            "Bitiş (sn)": [], 
-            "Sözler": []
-        })
-        
-        lyrics_df = gr.Dataframe(
-            value=empty_df,
-            headers=["Sıra", "Başlangıç (sn)", "Bitiş (sn)", "Sözler"],
-            datatype=["number", "number", "number", "str"],
-            interactive=True,
-            col_count=(4, "fixed"),
-            row_count=1
-        )
-        
-        save_button = gr.Button(
-            "Zaman Düzeltmelerini Kaydet", 
-            variant="primary",
-            interactive=True
-        )
+    head, _, rest = line.partition(',')
+    _, _, rest = rest.partition(',')
+    _, _, tail = rest.partition(',')
+    return f"{head},{start_time},{end_time},{tail}"
+
+def _ass_times_to_seconds(times):
+    """
+    ASS zaman sütununu (0:00:00.00) toplu olarak saniyeye çevirir
+    
+    Args:
+        times (pd.Series): ASS zaman metinleri
         
-        return lyrics_df, save_button
+    Returns:
+        pd.Series: Saniye cinsinden zamanlar (çevrilemeyenler 0.0)
+    """
+    import pandas as pd
+
+    hms = times.str.split(':', n=2, expand=True).reindex(columns=range(3))
+    seconds = (
+        pd.to_numeric(hms[0], errors='coerce') * 3600
+        + pd.to_numeric(hms[1], errors='coerce') * 60
+        + pd.to_numeric(hms[2], errors='coerce')
+    )
+    return seconds.fillna(0.0).to_numpy(dtype=np.float64)
+
+def _build_timing_dataframe(ass_file, lyrics_json):
+    """
+    Zaman düzenleme tablosunu ASS dosyasından ya da lyrics JSON verisinden oluşturur
     
+    Args:
+        ass_file (Path): karaoke_subtitles.ass dosyasının yolu
+        lyrics_json: Şarkı sözlerinin JSON verisi
+        
+    Returns:
+        pd.DataFrame: Sıra, Başlangıç, Bitiş ve Sözler sütunları
+    """
+    # pandas ve gradio yalnızca editör kullanıldığında yüklenir (import önbelleğe alınır)
+    import pandas as pd
+
     rows = []
-    # ASS dosyasını kontrol et
-    ass_file = Path(working_dir) / "karaoke_subtitles.ass"
-    
     if ass_file.exists():
         try:
             # ASS dosyasından Dialogue satırlarını çıkar
             dialogue_lines = extract_dialogue_lines(ass_file)
             
-            for i, (_, line) in enumerate(dialogue_lines):
-                # Dialogue: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
-                parts = line.split(',', 9)
-                if len(parts) >= 10:
-                    # Zamanları al
-                    start_time = parts[1].strip()
-                    end_time = parts[2].strip()
-                    text = parts[9].strip()
-                    
-                    # Zamanları saniyeye çevir
-                    start_seconds = parse_ass_time(start_time)
-                    end_seconds = parse_ass_time(end_time)
-                    
-                    # Metni temizle (stil komutlarını kaldır)
-                    clean_text = re.sub(r'\\N', ' ', text)  # Yeni satır karakterlerini boşluğa dönüştür
-                    clean_text = re.sub(r'{.*?}', '', clean_text)  # Stil komutlarını kaldır
-                    
-                    rows.append({
-                        "Sıra": i + 1,
-                        "Başlangıç (sn)": start_seconds,
-                        "Bitiş (sn)": end_seconds,
-                        "Sözler": clean_text
-                    })
+            # Dialogue: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+            fields = [(i, line.split(',', 9)) for i, (_, line) in enumerate(dialogue_lines)]
+            fields = [(i, parts) for i, parts in fields if len(parts) >= 10]
+
+            if fields:
+                # Ham alanları sütunlara topla, dönüşümleri pandas ile toplu yap
+                raw = pd.DataFrame({
+                    "start": [parts[1].strip() for _, parts in fields],
+                    "end": [parts[2].strip() for _, parts in fields],
+                    "text": [parts[9].strip() for _, parts in fields]
+                })
+                rows = {
+                    "Sıra": np.fromiter((i + 1 for i, _ in fields), dtype=np.int64, count=len(fields)),
+                    "Başlangıç (sn)": _ass_times_to_seconds(raw["start"]),
+                    "Bitiş (sn)": _ass_times_to_seconds(raw["end"]),
+                    # Metni temizle: \N -> boşluk, {...} stil komutları -> kaldır (tek geçişte)
+                    "Sözler": raw["text"].str.replace(_ASS_STRIP, _ass_strip_repl, regex=True).to_numpy(dtype=object)
+                }
             
-            logger.info(f"ASS dosyasından {len(rows)} satır okundu")
+            logger.info(f"ASS dosyasından {len(fields)} satır okundu")
         except Exception as e:
             logger.error(f"ASS okuma hatası: {e}")
     
     # Eğer ASS'den satır okunamadıysa ve lyrics_json mevcutsa, ondan oku
     if not rows and lyrics_json:
         try:
-            for i, verse in enumerate(lyrics_json):
-                # Her bir verse için kelimeleri birleştir
-                if "words" in verse:
-                    words_text = " ".join([word.get("word", "") for word in verse["words"]])
-                    rows.append({
-                        "Sıra": i + 1,
-                        "Başlangıç (sn)": round(verse.get("start", 0), 2),
-                        "Bitiş (sn)": round(verse.get("end", 0), 2),
-                        "Sözler": words_text
-                    })
-            logger.info(f"JSON verisinden {len(rows)} satır okundu")
+            # Sütunları tek seferde oluştur (satır satır dict yerine)
+            verses = [(i, verse) for i, verse in enumerate(lyrics_json) if "words" in verse]
+            n = len(verses)
+            if n:
+                starts = np.fromiter((v.get("start", 0) for _, v in verses), dtype=np.float64, count=n)
+                ends = np.fromiter((v.get("end", 0) for _, v in verses), dtype=np.float64, count=n)
+                rows = {
+                    "Sıra": np.fromiter((i + 1 for i, _ in verses), dtype=np.int64, count=n),
+                    "Başlangıç (sn)": np.round(starts, 2),
+                    "Bitiş (sn)": np.round(ends, 2),
+                    "Sözler": [" ".join(word.get("word", "") for word in v["words"]) for _, v in verses]
+                }
+            logger.info(f"JSON verisinden {n} satır okundu")
         except Exception as e:
             logger.error(f"JSON okuma hatası: {e}")
     
@@ -202,12 +232,91 @@ def create_lyrics_timing_editor(working_dir, lyrics_json):
         df = pd.DataFrame(rows)
     else:
         # Boş DataFrame
-        df = pd.DataFrame({
-            "Sıra": [], 
-            "Başlangıç (sn)": [], 
-            "Bitiş (sn)": [], 
-            "Sözler": []
-        })
+        df = empty_timing_dataframe()
+
+    return df
+
+def empty_timing_dataframe():
+    """
+    Yalnızca başlıkları olan boş zaman düzenleme tablosunu döndürür
+    
+    Returns:
+        pd.DataFrame: Boş Sıra, Başlangıç, Bitiş ve Sözler sütunları
+    """
+    import pandas as pd
+
+    return pd.DataFrame({
+        "Sıra": [], 
+        "Başlangıç (sn)": [], 
+        "Bitiş (sn)": [], 
+        "Sözler": []
+    })
+
+def get_timing_dataframe(working_dir, lyrics_json):
+    """
+    Zaman düzenleme tablosunun verisini döndürür (bileşen oluşturmadan).
+    Aynı ASS dosyası ve lyrics JSON için önceki tablo yeniden kullanılır.
+    
+    Args:
+        working_dir: Çalışma dizini
+        lyrics_json: Şarkı sözlerinin JSON verisi
+        
+    Returns:
+        pd.DataFrame: Sıra, Başlangıç, Bitiş ve Sözler sütunları
+    """
+    # ASS dosyasını kontrol et
+    ass_file = Path(working_dir) / "karaoke_subtitles.ass"
+    try:
+        ass_mtime = ass_file.stat().st_mtime_ns
+    except OSError:
+        ass_mtime = None
+
+    # Aynı girdiler için tabloyu yeniden oluşturma
+    cache_key = (str(working_dir), ass_mtime, _lyrics_fingerprint(lyrics_json))
+    df = _df_cache.get(cache_key)
+    if df is not None:
+        _df_cache.move_to_end(cache_key)
+    else:
+        df = _build_timing_dataframe(ass_file, lyrics_json)
+        _df_cache[cache_key] = df
+        # En eski kayıtları at (önbellek sınırlı kalır)
+        while len(_df_cache) > _DF_CACHE_SIZE:
+            _df_cache.popitem(last=False)
+
+    return df
+
+def create_lyrics_timing_editor(working_dir, lyrics_json):
+    """
+    Şarkı sözleri için zaman düzenleme bileşenini oluşturur
+    
+    Args:
+        working_dir: Çalışma dizini
+        lyrics_json: Şarkı sözlerinin JSON verisi
+        
+    Returns:
+        tuple: (lyrics_df, save_button)
+    """
+    import gradio as gr
+
+    if not working_dir:
+        # Eğer working_dir yoksa boş bir tablo döndür (yalnızca başlıklar; pandas gerekmez)
+        lyrics_df = gr.Dataframe(
+            headers=["Sıra", "Başlangıç (sn)", "Bitiş (sn)", "Sözler"],
+            datatype=["number", "number", "number", "str"],
+            interactive=True,
+            col_count=(4, "fixed"),
+            row_count=1
+        )
+        
+        save_button = gr.Button(
+            "Zaman Düzeltmelerini Kaydet", 
+            variant="primary",
+            interactive=True
+        )
+        
+        return lyrics_df, save_button
+    
+    df = get_timing_dataframe(working_dir, lyrics_json)
     
     # Gradio Dataframe bileşeni
     lyrics_df = gr.Dataframe(
@@ -235,15 +344,19 @@ def save_timing_changes(df, working_dir, lyrics_json):
     Returns:
         tuple: (Güncellenmiş lyrics JSON verisi, Durum mesajı)
     """
+    import pandas as pd
+
     try:
         # Eğer df bir dict ise (Gradio'nun davranışı nedeniyle), DataFrame'e çevir
         if isinstance(df, dict):
             df = pd.DataFrame(df)
 
-        # Debug için
-        print(f"DF tipi: {type(df)}")
-        print(f"DF boş mu: {df.empty}")
-        print(f"Working dir: {working_dir}")
+        # lyrics_json normalde zaten ayrıştırılmış listedir; yalnızca metin gelirse ayrıştır
+        if isinstance(lyrics_json, (str, bytes)):
+            lyrics_json = json.loads(lyrics_json)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"DF tipi: {type(df)}, boş mu: {df.empty}, working dir: {working_dir}")
 
         # Eğer working_dir yoksa veya dataframe boşsa, basit bir uyarı göster
         if not working_dir or df.empty:
@@ -252,6 +365,43 @@ def save_timing_changes(df, working_dir, lyrics_json):
         working_dir = Path(working_dir)
         if not working_dir.exists():
             return lyrics_json, f"Hata: Çalışma dizini bulunamadı: {working_dir}"
+
+        # Sütun adlarını döngüden önce bir kez çöz (Türkçe başlıklar yoksa İngilizce'ye düş)
+        cols = df.columns
+        col_start = "Başlangıç (sn)" if "Başlangıç (sn)" in cols else "start"
+        col_end = "Bitiş (sn)" if "Bitiş (sn)" in cols else "end"
+        col_sira = "Sıra" if "Sıra" in cols else None
+        col_text = "Sözler" if "Sözler" in cols else ("text" if "text" in cols else None)
+
+        # Sütunları bir kez diziye çevir (iterrows her satır için Series oluşturur)
+        # Sayıya çevrilemeyen ya da boş hücreler NaN olur; bu satırlar atlanır (ASS/JSON'a yazılmaz)
+        n_rows = len(df.index)
+        starts = pd.to_numeric(df[col_start], errors="coerce").to_numpy(dtype=np.float64)
+        ends = pd.to_numeric(df[col_end], errors="coerce").to_numpy(dtype=np.float64)
+        valid_mask = np.isfinite(starts) & np.isfinite(ends)
+        valid_rows = valid_mask.tolist()
+        for idx in np.flatnonzero(~valid_mask).tolist():
+            logger.error(
+                f"Satır işlemede hata: geçersiz zaman (satır {idx + 1}): "
+                f"başlangıç={df[col_start].iloc[idx]}, bitiş={df[col_end].iloc[idx]}"
+            )
+        start_list = starts.tolist()
+        end_list = ends.tolist()
+
+        # Düzenlenen tablo kullanıcıya gösterilen tabloyla (ASS ya da JSON kaynaklı) aynıysa diske dokunma
+        shown_df = get_timing_dataframe(working_dir, lyrics_json)
+        if len(shown_df.index) == n_rows and (
+            col_sira is None or np.array_equal(
+                df[col_sira].to_numpy(dtype=np.int64), shown_df["Sıra"].to_numpy(dtype=np.int64)
+            )
+        ):
+            # Tablo zamanları 2 basamağa yuvarlanmış gösterilir
+            if np.array_equal(np.round(shown_df["Başlangıç (sn)"].to_numpy(dtype=np.float64), 2), np.round(starts, 2)) and \
+                    np.array_equal(np.round(shown_df["Bitiş (sn)"].to_numpy(dtype=np.float64), 2), np.round(ends, 2)):
+                return lyrics_json, "Değişiklik yok."
+
+        # Kaydedilen zamanlar önbellekteki tabloyu geçersiz kılar
+        _invalidate_df_cache(working_dir)
         
         # 1. ASS dosyasını güncelle (eğer varsa)
         ass_file = working_dir / "karaoke_subtitles.ass"
@@ -260,27 +410,24 @@ def save_timing_changes(df, working_dir, lyrics_json):
                 # ASS dosyasını oku
                 lines = read_ass_file(ass_file)
                 
-                # Dialogue satırlarının indekslerini bul
-                dialogue_lines = extract_dialogue_lines(ass_file)
+                # Dialogue satırlarının indekslerini okunan satırlardan bul
+                dialogue_lines = extract_dialogue_lines(lines)
                 
                 # DataFrame'deki değişiklikleri ASS satırlarına uygula
-                for i, row in df.iterrows():
-                    if i < len(dialogue_lines):
-                        line_idx, _ = dialogue_lines[i]
-                        
-                        # Satırı parse et
-                        parts = lines[line_idx].split(',', 9)
-                        if len(parts) >= 10:
-                            # Yeni zamanları ASS formatına çevir
-                            start_time = seconds_to_ass_time(float(row["Başlangıç (sn)"]))
-                            end_time = seconds_to_ass_time(float(row["Bitiş (sn)"]))
-                            
-                            # Zamanları güncelle
-                            parts[1] = start_time
-                            parts[2] = end_time
-                            
-                            # Satırı yeniden oluştur
-                            lines[line_idx] = ','.join(parts)
+                for i in range(min(n_rows, len(dialogue_lines))):
+                    if not valid_rows[i]:
+                        continue
+                    line_idx, _ = dialogue_lines[i]
+                    
+                    # Dialogue: Layer, Start, End, ... Text -> en az 9 virgül olmalı
+                    line = lines[line_idx]
+                    if line.count(',') >= 9:
+                        # Yeni zamanları ASS formatına çevirip yalnızca 2. ve 3. alanı değiştir
+                        lines[line_idx] = _rewrite_ass_times(
+                            line,
+                            seconds_to_ass_time(start_list[i]),
+                            seconds_to_ass_time(end_list[i])
+                        )
                 
                 # Değişiklikleri kaydet
                 if write_ass_file(ass_file, lines):
@@ -292,53 +439,69 @@ def save_timing_changes(df, working_dir, lyrics_json):
         
         # 2. JSON dosyalarını da güncelle (geriye dönük uyumluluk için)
         if lyrics_json:
-            updated_lyrics = []
+            # Çıktı uzunluğu en fazla satır sayısı kadardır; listeyi önceden ayır
+            updated_lyrics = [None] * n_rows
+            write_ptr = 0
             
-            logger.debug(f"DF satır sayısı: {len(df.index)}")
-            for idx, row in df.iterrows():
+            logger.debug(f"DF satır sayısı: {n_rows}")
+            # Sıra sütunu yoksa doğrudan satır indeksini kullan
+            sira_list = df[col_sira].tolist() if col_sira else None
+            text_list = df[col_text].tolist() if col_text else None
+            is_list = isinstance(lyrics_json, list)
+            n_verses = len(lyrics_json) if is_list else 0
+            for idx in range(n_rows):
+                if not valid_rows[idx]:
+                    continue
                 try:
-                    # Sıra sütununun değerini al, 1'den başladığı için 1 çıkar
-                    if "Sıra" in row:
-                        sira_idx = int(row["Sıra"]) - 1
-                    else:
-                        # Eğer Sıra sütunu yoksa, doğrudan indeksi kullan
-                        sira_idx = idx
+                    # Sıra 1'den başladığı için 1 çıkar
+                    sira_idx = int(sira_list[idx]) - 1 if sira_list is not None else idx
+                    start = start_list[idx]
+                    end = end_list[idx]
                     
-                    # Eğer lyrics_json mevcutsa, orijinal verse'ü kullan
-                    if isinstance(lyrics_json, list) and 0 <= sira_idx < len(lyrics_json):
+                    # Eğer lyrics_json mevcutsa, orijinal verse'ün kopyasını kullan
+                    # (oturum state'i yalnızca kayıt başarılı olursa yeni listeyle değişir)
+                    if is_list and 0 <= sira_idx < n_verses:
                         original_verse = lyrics_json[sira_idx].copy()
                         
                         # Başlangıç ve bitiş değerlerini güncelle
-                        original_verse["start"] = float(row["Başlangıç (sn)"])
-                        original_verse["end"] = float(row["Bitiş (sn)"])
+                        original_verse["start"] = start
+                        original_verse["end"] = end
                         
-                        updated_lyrics.append(original_verse)
+                        updated_lyrics[write_ptr] = original_verse
                     else:
                         # Eğer lyrics_json mevcut değilse veya verse bulunamadıysa, yeni bir verse oluştur
                         new_verse = {
-                            "start": float(row["Başlangıç (sn)"]),
-                            "end": float(row["Bitiş (sn)"]),
+                            "start": start,
+                            "end": end,
                             "words": [{
                                 "word": word.strip(), 
-                                "start": float(row["Başlangıç (sn)"]), 
-                                "end": float(row["Bitiş (sn)"])
-                            } for word in row["Sözler"].split()]
+                                "start": start, 
+                                "end": end
+                            } for word in str(text_list[idx] if text_list is not None else "").split()]
                         }
-                        updated_lyrics.append(new_verse)
+                        updated_lyrics[write_ptr] = new_verse
+                    write_ptr += 1
                 except Exception as e:
                     logger.error(f"Satır işlemede hata: {e}")
+            # Hatalı satırlar nedeniyle kullanılmayan yerleri kırp
+            del updated_lyrics[write_ptr:]
             
             # JSON dosyalarını güncelle
             try:
-                # Önce raw_lyrics.json dosyasını güncelle
+                # JSON'u bir kez serileştir ve yaz
+                data = json.dumps(updated_lyrics, indent=4, ensure_ascii=False).encode("utf-8")
+
+                # Önce geçici dosyaya yaz, sonra atomik olarak yerine taşı (yarım yazılmış dosya kalmaz)
                 raw_file = working_dir / "raw_lyrics.json"
-                with open(raw_file, "w", encoding="utf-8") as f:
-                    json.dump(updated_lyrics, f, indent=4, ensure_ascii=False)
-                
-                # Sonra modified_lyrics.json dosyasını güncelle
+                raw_tmp = raw_file.with_suffix(".json.tmp")
+                raw_tmp.write_bytes(data)
+                os.replace(raw_tmp, raw_file)
+
+                # İkinci dosya çekirdek içi kopyayla oluşturulur (hardlink değil; dosyalar bağımsız kalmalı)
                 output_file = working_dir / "modified_lyrics.json"
-                with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(updated_lyrics, f, indent=4, ensure_ascii=False)
+                output_tmp = output_file.with_suffix(".json.tmp")
+                shutil.copyfile(raw_file, output_tmp)
+                os.replace(output_tmp, output_file)
                 
                 logger.info(f"JSON dosyaları güncellendi: {raw_file} ve {output_file}")
                 return updated_lyrics, "Zaman düzeltmeleri başarıyla kaydedildi! ASS ve JSON dosyaları güncellendi."
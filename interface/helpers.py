@@ -1,15 +1,22 @@
 # Standard Library Imports
-from typing import List, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Union
 from pathlib import Path
 import logging
 import json
 import os
 
 # Third-Party Imports
-import pandas as pd
 import gradio as gr
 from deep_translator import GoogleTranslator
 
+# Local Application Imports
+from modules.subtitle_processing.config import get_available_colors, get_font_list
+
+# pandas is only needed for type hints here
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Initialize logger
 logger = logging.getLogger(__name__)
 
@@ -28,7 +35,7 @@ def load_json_file(file_path: Union[str, Path]) -> Union[List, dict, None]:
         logger.error(f"Could not load JSON file {file_path}: {e}")
         return None
 
-def delete_row_from_dataframe(dataframe: pd.DataFrame, row_index: int) -> pd.DataFrame:
+def delete_row_from_dataframe(dataframe: "pd.DataFrame", row_index: int) -> "pd.DataFrame":
     """
     Deletes a specific row from the dataframe and updates the associated JSON file.
     
@@ -51,16 +58,18 @@ def delete_row_from_dataframe(dataframe: pd.DataFrame, row_index: int) -> pd.Dat
     
     return dataframe
 
-def update_json_file(dataframe: pd.DataFrame):
+def update_json_file(dataframe: "pd.DataFrame"):
     """
     Updates the lyrics stored in the JSON file based on the modified DataFrame.
     
     Args:
     - dataframe (pd.DataFrame): The modified DataFrame of lyrics.
     """
-    updated_lyrics = []
-    for _, row in dataframe.iterrows():
-        updated_lyrics.append({"words": [{"word": row["Processed Lyrics (Used for Karaoke)"]}]})
+    # Iterate the single column directly instead of building a Series per row
+    updated_lyrics = [
+        {"words": [{"word": text}]}
+        for text in dataframe["Processed Lyrics (Used for Karaoke)"].tolist()
+    ]
 
     try:
         with open("processed_lyrics.json", "w", encoding="utf-8") as f:
@@ -86,18 +95,46 @@ def get_effect_video_list(effects_dir: Union[str, Path]) -> list:
     Scans the 'effects_dir' folder for .mp4 files
     and returns a list of file names (e.g. ["snow.mp4", "fire.mp4", ...])
     """
+    # The directory is scanned once per process; return a copy so callers can extend it
+    return list(_scan_effect_videos(str(Path(effects_dir))))
+
+
+@lru_cache(maxsize=None)
+def _scan_effect_videos(effects_dir: str) -> tuple:
+    """Cached directory scan behind `get_effect_video_list`."""
     effects_dir = Path(effects_dir)
     if not effects_dir.exists() or not effects_dir.is_dir():
-        return []
+        return ()
 
     # Gather .mp4
-    video_files = [f.name for f in effects_dir.glob("*.mp4") if f.is_file()]
-    return video_files
+    return tuple(f.name for f in effects_dir.glob("*.mp4") if f.is_file())
+
+
+@lru_cache(maxsize=None)
+def _cached_font_list(fonts_dir: str) -> dict:
+    """Cached directory scan behind `get_cached_font_list`."""
+    return get_font_list(fonts_dir)
+
+
+def get_cached_font_list(fonts_dir: Union[str, Path]) -> dict:
+    """
+    Returns the font name -> path dictionary for 'fonts_dir',
+    scanning the directory only on the first call per process.
+    """
+    return _cached_font_list(str(Path(fonts_dir)))
+
+
+@lru_cache(maxsize=1)
+def get_cached_colors() -> dict:
+    """Returns the ASS color dictionary, built once per process."""
+    return get_available_colors()
 
 
+@lru_cache(maxsize=1)
 def get_available_languages():
     """
     Retrieve available language codes and names for translation.
+    The result is cached for the lifetime of the process; do not mutate it.
     
     Returns:
         dict: Dictionary of language names and codes.
@@ -140,31 +177,55 @@ def display_text_from_lyrics(json_file: Union[str, Path]) -> str:
         return f"Error: {e}"
 
 
-def display_dataframe_from_lyrics(json_path: Union[str, Path]) -> pd.DataFrame:
+def lines_from_lyrics(data: list) -> str:
+    """
+    Returns the verse texts of already-loaded lyrics as a newline-separated string
+    (one verse per line).
+    """
+    # Combine the words array of each verse into one line
+    return "\n".join(
+        " ".join(w["word"] for w in verse_info["words"])
+        for verse_info in data
+    )
+
+
+def display_lines_from_lyrics(json_path: Union[str, Path]) -> str:
     """
     Loads raw_lyrics.json (or modified_lyrics.json) 
-    and converts to a Pandas DataFrame with a single column:
-    - Lyrics (the combined text)
+    and returns the verse texts as a newline-separated string (one verse per line).
     """
     try:
         with open(json_path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
-        rows = []
-        for verse_info in data:
-            # Option 1: Use the "text" field directly if it already has full verse text
-            # verse_text = verse_info.get("text", "")
+        return lines_from_lyrics(data)
+    except Exception as e:
+        print(f"Error reading {json_path}: {e}")
+        return ""
+
 
-            # Option 2: Or combine the words array if you want them re-joined:
-            verse_text = " ".join(w["word"] for w in verse_info["words"])
+def _working_dir_mtime(working_dir: str) -> Optional[int]:
+    """
+    Returns the directory's mtime (ns) or None if it does not exist.
+    The mtime changes whenever a file is created, removed or renamed inside it,
+    which is exactly what the availability checks below depend on.
+    """
+    try:
+        return os.stat(working_dir).st_mtime_ns
+    except OSError:
+        return None
 
-            rows.append({"Processed Lyrics (Used for Karaoke)": verse_text})
 
-        df = pd.DataFrame(rows)
-        return df
-    except Exception as e:
-        print(f"Error reading {json_path}: {e}")
-        return pd.DataFrame(columns=["Lyrics"])
+@lru_cache(maxsize=64)
+def _modify_ai_available(working_dir: str, mtime_ns: int) -> bool:
+    wd = Path(working_dir)
+    return (wd / "raw_lyrics.json").is_file() and (wd / "reference_lyrics.json").is_file()
+
+
+@lru_cache(maxsize=64)
+def _generate_karaoke_available(working_dir: str, mtime_ns: int) -> bool:
+    wd = Path(working_dir)
+    return (wd / "raw_lyrics.json").is_file() or (wd / "modified_lyrics.json").is_file()
 
 
 def check_modify_ai_availability(working_dir: str) -> dict:
@@ -174,21 +235,18 @@ def check_modify_ai_availability(working_dir: str) -> dict:
      - raw_lyrics.json exists, AND
      - reference_lyrics.json (or official_lyrics.json) exists.
     Otherwise, disable it.
+    The file probes are cached per (working_dir, directory mtime).
     """
     if not working_dir:
         return gr.update(interactive=False)  # No working dir -> disable
-    
-    wd = Path(working_dir)
-    raw_path = wd / "raw_lyrics.json"
-    ref_path = wd / "reference_lyrics.json"
-
-    if raw_path.is_file() and ref_path.is_file():
-        # Both files exist -> enable button
-        return gr.update(interactive=True)
-    else:
-        # Something missing -> disable
+
+    mtime_ns = _working_dir_mtime(working_dir)
+    if mtime_ns is None:
         return gr.update(interactive=False)
 
+    # Both files exist -> enable button, something missing -> disable
+    return gr.update(interactive=_modify_ai_available(str(working_dir), mtime_ns))
+
 
 def check_generate_karaoke_availability(working_dir: str) -> dict:
     """
@@ -197,20 +255,18 @@ def check_generate_karaoke_availability(working_dir: str) -> dict:
      - raw_lyrics.json exists, OR
      - modified_lyrics.json exists.
     Otherwise, disable it.
+    The file probes are cached per (working_dir, directory mtime).
     """
     if not working_dir:
         return gr.update(interactive=False)
-    
-    wd = Path(working_dir)
-    raw_path = wd / "raw_lyrics.json"
-    modified_path = wd / "modified_lyrics.json"
 
-    if raw_path.is_file() or modified_path.is_file():
-        # At least one of them exists -> enable
-        return gr.update(interactive=True)
-    else:
+    mtime_ns = _working_dir_mtime(working_dir)
+    if mtime_ns is None:
         return gr.update(interactive=False)
 
+    # At least one of them exists -> enable
+    return gr.update(interactive=_generate_karaoke_available(str(working_dir), mtime_ns))
+
 
 def get_font_format(filepath: str) -> str:
     """
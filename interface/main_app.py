@@ -1,6 +1,7 @@
 import gradio as gr
-import pandas as pd
 import os
+from pathlib import Path
+from functools import lru_cache
 
 # Local Application Imports
 from .callbacks import (
@@ -11,51 +12,46 @@ from .callbacks import (
     generate_font_preview_callback,
     generate_subtitles_and_video_callback,
     save_metadata_callback,
+    with_toasts,
 )
 from .helpers import (
     check_modify_ai_availability,
     check_generate_karaoke_availability,
     get_effect_video_list,
     get_available_languages,
+    get_cached_colors,
+    get_cached_font_list,
 )
-from modules import (
-    get_available_colors,
-    get_font_list,
-    process_karaoke_subtitles,
+from modules import process_karaoke_subtitles
+from .components.lyrics_timing_editor import (
+    create_lyrics_timing_editor,
+    empty_timing_dataframe,
+    get_timing_dataframe,
+    save_timing_changes,
 )
-from .components.lyrics_timing_editor import create_lyrics_timing_editor, save_timing_changes
 
 # Main App Interface
 def main_app(cache_dir, fonts_dir, output_dir, project_root):
-    gr.set_static_paths(fonts_dir)
+    # Altyazılar için mevcut yazı tipleri
+    available_fonts = get_cached_font_list(fonts_dir)
+
+    # Tüm klasör yerine yalnızca bilinen font dosyaları servis edilir;
+    # Gradio her istekte klasörü taramak yerine tam yol eşleşmesi yapar.
+    gr.set_static_paths(paths=[Path(font_path).resolve() for font_path in available_fonts.values()])
     with gr.Blocks(theme='shivi/calm_seafoam') as app:
         effects_dir = project_root / "effects"
 
-        # Altyazılar için mevcut yazı tipleri ve renkleri al
-        available_fonts = get_font_list(fonts_dir)
-        available_colors = get_available_colors()
+        # Altyazılar için mevcut renkleri al
+        available_colors = get_cached_colors()
         available_effects = ["Yok"] + get_effect_video_list(effects_dir)
 
         # get_available_languages() fonksiyonu bir sözlük döndürüyor.
-        # Aşağıdaki kodda, sözlük anahtarlarını (dil isimlerini) önce listeye alıyoruz,
-        # sonra "turkish" ve "english" (küçük harf karşılaştırmasıyla) varsa bunları listenin
-        # başına yerleştiriyoruz.
-        langs = list(get_available_languages().keys())
-
-        langs_lower = [lang.lower() for lang in langs]
-        if "turkish" in langs_lower:
-            index = langs_lower.index("turkish")
-            turkish_lang = langs.pop(index)
-            langs.insert(0, turkish_lang)
-
-        # "turkish" eklenmişse, "english" ikinci sıraya yerleştiriyoruz.
-        langs_lower = [lang.lower() for lang in langs]
-        if "english" in langs_lower:
-            index = langs_lower.index("english")
-            english_lang = langs.pop(index)
-            langs.insert(1, english_lang)
+        # Dil isimlerini tek bir kararlı sıralamayla "turkish" ve "english" başa gelecek
+        # şekilde diziyoruz; diğer diller mevcut sıralarını korur.
+        lang_priority = {"turkish": 0, "english": 1}
+        langs = sorted(get_available_languages().keys(), key=lambda lang: lang_priority.get(lang.lower(), 2))
 
-        available_langs = ["Otomatik Algılama"] + langs
+        available_langs = ["Otomatik Algılama", *langs]
         ##############################################################################
         # DURUM DEĞİŞKENLERİ
         ##############################################################################
@@ -66,6 +62,10 @@ def main_app(cache_dir, fonts_dir, output_dir, project_root):
         state_fetched_lyrics_display = gr.State(value="")
         state_artist_name = gr.State(value="")
         state_song_name = gr.State(value="")
+        # Sabit dizinler bir kez oluşturulup tüm olaylarda paylaşılır
+        state_cache_dir = gr.State(value=cache_dir)
+        state_output_dir = gr.State(value=str(output_dir))
+        state_effects_dir = gr.State(value=str(effects_dir))
         ##############################################################################
         # SAYFA BAŞLIĞI
         ##############################################################################
@@ -175,16 +175,10 @@ def main_app(cache_dir, fonts_dir, output_dir, project_root):
                     save_button = gr.Button("💾 Referans Şarkı Sözlerini Güncelle")
             with gr.Column():
                 gr.Markdown("##### Kelime zamanlamalı Karaoke Altyazıları (düzeltilmiş).")
-                raw_lyrics_box = gr.Dataframe(
-                    value=pd.DataFrame({
-                        "Karaoke için Kullanılan İşlenmiş Şarkı Sözleri": ["" for _ in range(12)]
-                    }),
-                    headers=["Karaoke için Kullanılan İşlenmiş Şarkı Sözleri"],
+                raw_lyrics_box = gr.Textbox(
                     label="Karaoke için Kullanılan İşlenmiş Şarkı Sözleri",
-                    datatype=["str"],
+                    lines=20,
                     interactive=False,
-                    show_label=False,
-                    max_height=465,
                 )
                 with gr.Row():
                     modify_button = gr.Button(
@@ -299,8 +293,8 @@ def main_app(cache_dir, fonts_dir, output_dir, project_root):
                         label="Çözünürlük"
                     )
                     preset_input = gr.Dropdown(
-                        choices=["ultrafast", "fast", "medium", "slow"],
-                        value="fast",
+                        choices=["ultrafast", "veryfast", "fast", "medium", "slow"],
+                        value="veryfast",
                         label="FFmpeg Ön Ayarı"
                     )
                 with gr.Column():
@@ -354,16 +348,29 @@ def main_app(cache_dir, fonts_dir, output_dir, project_root):
         gr.HTML("<hr>")
 
         # Şarkı sözleri zaman düzenleme fonksiyonu
+        # Bileşenleri yeniden oluşturmak yerine yalnızca tablo değerini günceller
         def update_lyrics_timing_editor(working_dir, lyrics_json):
             if working_dir and lyrics_json:
-                return create_lyrics_timing_editor(working_dir, lyrics_json)
-            return create_lyrics_timing_editor(None, None)
+                return gr.update(value=get_timing_dataframe(working_dir, lyrics_json)), gr.update(interactive=True)
+            # Veri yoksa önceki şarkının tablosu ekranda kalmasın
+            return gr.update(value=empty_timing_dataframe()), gr.update(interactive=True)
             
         ##############################################################################
         # ALTYAZI STİL ÖNİZLEMESİ (renk/yazı tipi değişikliklerinde)
         ##############################################################################
-        def update_subtitle_preview(*args):
-            return generate_font_preview_callback(*args, available_fonts=available_fonts)
+        # Yazı tipi sözlüğü closure yerine oturum state'i olarak aktarılır
+        state_fonts = gr.State(available_fonts)
+
+        # Aynı ayarlar için HTML önizlemesi yeniden oluşturulmaz (slider sürüklemelerinde sık tekrarlanır).
+        # Sözlük hashlenemediği için önbellek anahtarı seçili fontun dosya yoludur.
+        @lru_cache(maxsize=256)
+        def _cached_subtitle_preview(font, font_path, pc, sc, oc, os_, shc, shs):
+            return generate_font_preview_callback(
+                font, pc, sc, oc, os_, shc, shs, available_fonts={font: font_path}
+            )
+
+        def update_subtitle_preview(font, pc, sc, oc, os_, shc, shs, fonts):
+            return _cached_subtitle_preview(font, fonts[font], pc, sc, oc, os_, shc, shs)
 
         font_preview_inputs = [
             font_input,
@@ -375,18 +382,36 @@ def main_app(cache_dir, fonts_dir, output_dir, project_root):
             shadow_size_input,
         ]
         for component in font_preview_inputs:
-            component.change(fn=update_subtitle_preview, inputs=font_preview_inputs, outputs=subtitle_preview_output)
+            # Yeni bir değişiklik gelirse yalnızca en son değer işlenir
+            component.change(
+                fn=update_subtitle_preview,
+                inputs=[*font_preview_inputs, state_fonts],
+                outputs=subtitle_preview_output,
+                trigger_mode="always_last",
+                show_progress="hidden",
+                concurrency_limit=16,
+                concurrency_id="ui"
+            )
 
         ####################################################################
         # MANUEL OLARAK BUTONU PASİFLEŞTİREN VE GERİ AÇAN FONKSİYONLAR
+        # (Sunucuya gidilmeden doğrudan tarayıcıda çalışır)
         ####################################################################
-        def on_start():
-            """Sesi İşle butonunu pasifleştirip, metnini 'Lütfen bekleyin...' yapar."""
-            return gr.update(value="Lütfen bekleyin...", interactive=False)
+        # Sesi İşle butonunu pasifleştirip, metnini 'Lütfen bekleyin...' yapar.
+        on_start_js = "() => ({__type__: 'update', value: 'Lütfen bekleyin...', interactive: false})"
 
-        def on_finish():
-            """İşlem bitince buton metnini eski hâline döndürüp tekrar tıklanabilir yapar."""
-            return gr.update(value="Sesi İşle", interactive=True)
+        # İşlem bitince buton metnini eski hâline döndürüp tekrar tıklanabilir yapar.
+        on_finish_js = "() => ({__type__: 'update', value: 'Sesi İşle', interactive: true})"
+
+        def after_process_audio(working_dir, disp, artist, song):
+            """Ses işleme sonrası arayüz güncellemelerini tek çağrıda döndürür."""
+            return (
+                disp,
+                artist,
+                song,
+                check_modify_ai_availability(working_dir),
+                check_generate_karaoke_availability(working_dir)
+            )
 
         ##############################################################################
         # SES, ŞARKI SÖZÜ, VİDEO İÇİN GERİ ARAMA BAĞLANTILARI
@@ -394,15 +419,13 @@ def main_app(cache_dir, fonts_dir, output_dir, project_root):
 
         # (Birincil) Sesi İşle Butonu - Zincirli Kullanım
         process_audio_button.click(
-            fn=on_start,
+            fn=None,
             inputs=None,
-            outputs=process_audio_button # Butonu güncelleyeceğiz
+            outputs=process_audio_button, # Butonu güncelleyeceğiz
+            js=on_start_js
         ).then(
-            fn=lambda: gr.Info("Ses işleme başladı..."), # Başlangıç mesajı
-            inputs=None,
-            outputs=[]
-        ).then(
-            fn=process_audio_callback,
+            # Başlangıç/bitiş mesajları aynı olay içinde gösterilir
+            fn=with_toasts(process_audio_callback, "Ses işleme başladı...", "Ses işleme tamamlandı!"),
             inputs=[
                 audio_input,
                 force_meta_fetch,
@@ -418,7 +441,7 @@ def main_app(cache_dir, fonts_dir, output_dir, project_root):
                 state_working_dir,
                 state_lyrics_json,
                 state_lyrics_display,
-                gr.State(cache_dir),
+                state_cache_dir,
             ],
             outputs=[
                 state_working_dir,
@@ -426,10 +449,15 @@ def main_app(cache_dir, fonts_dir, output_dir, project_root):
                 state_lyrics_display,
                 state_artist_name,
                 state_song_name,
-            ]
+            ],
+            # GPU/ffmpeg kullanan ağır işler tek kuyrukta sırayla çalışır
+            concurrency_limit=1,
+            concurrency_id="gpu"
         ).then(
-            fn=lambda disp, artist, song: (disp, artist, song),
+            # Görüntü alanları ve buton durumları tek adımda güncellenir
+            fn=after_process_audio,
             inputs=[
+                state_working_dir,
                 state_lyrics_display,
                 state_artist_name,
                 state_song_name
@@ -437,128 +465,104 @@ def main_app(cache_dir, fonts_dir, output_dir, project_root):
             outputs=[
                 raw_lyrics_box,
                 artist_name_input,
-                song_name_input
+                song_name_input,
+                modify_button,
+                generate_karaoke_button
             ]
-        ).then(
-            fn=check_modify_ai_availability,
-            inputs=[state_working_dir],
-            outputs=modify_button
-        ).then(
-            fn=check_generate_karaoke_availability,
-            inputs=[state_working_dir],
-            outputs=generate_karaoke_button
         ).then(
             fn=update_lyrics_timing_editor,
             inputs=[state_working_dir, state_lyrics_json],
             outputs=[lyrics_timing_df, save_timing_button]
         ).then(
-            fn=on_finish,
+            fn=None,
             inputs=None,
-            outputs=process_audio_button # Butonu eski hâline döndür
-        ).then(
-            fn=lambda: gr.Info("Ses işleme tamamlandı!"), # Bitiş mesajı
-            inputs=None,
-            outputs=[]
+            outputs=process_audio_button, # Butonu eski hâline döndür
+            js=on_finish_js
         )
 
         # (İkincil) 💾 Sanatçı ve Şarkı Adını Kaydet Butonu
         save_metadata_button.click(
-            fn=lambda: gr.Info("Meta veri kaydetme başladı..."), # Başlangıç mesajı
-            inputs=None,
-            outputs=[]
-        ).then(
-            fn=save_metadata_callback,
+            fn=with_toasts(save_metadata_callback, "Meta veri kaydetme başladı...", "Meta veri kaydetme tamamlandı!"),
             inputs=[
                 state_working_dir,
                 artist_name_input,
                 song_name_input
             ],
-            outputs=[]
-        ).then(
-            fn=lambda: gr.Info("Meta veri kaydetme tamamlandı!"), # Bitiş mesajı
-            inputs=None,
-            outputs=[]
+            outputs=[],
+            concurrency_limit=8,
+            concurrency_id="io"
         )
 
         # (İkincil) 🌐 Referans Şarkı Sözlerini Al Butonu
         fetch_button.click(
-            fn=lambda: gr.Info("Referans şarkı sözleri çekme başladı..."), # Başlangıç mesajı
-            inputs=None,
-            outputs=[]
-        ).then(
-            fn=fetch_reference_lyrics_callback,
+            fn=with_toasts(
+                fetch_reference_lyrics_callback,
+                "Referans şarkı sözleri çekme başladı...",
+                "Referans şarkı sözleri çekme tamamlandı!"
+            ),
             inputs=[
                 force_refetch_lyrics,
                 state_working_dir,
                 state_fetched_lyrics_json,
-                state_fetched_lyrics_display
+                state_fetched_lyrics_display,
+                state_cache_dir,
             ],
             outputs=[
                 state_fetched_lyrics_json,
-                state_fetched_lyrics_display
-            ]
-        ).then(
-            fn=lambda disp: disp,
-            inputs=state_fetched_lyrics_display,
-            outputs=fetched_lyrics_box
+                state_fetched_lyrics_display,
+                fetched_lyrics_box
+            ],
+            concurrency_limit=8,
+            concurrency_id="io"
         ).then(
             fn=check_modify_ai_availability,
             inputs=[state_working_dir],
             outputs=modify_button
-        ).then(
-            fn=lambda: gr.Info("Referans şarkı sözleri çekme tamamlandı!"), # Bitiş mesajı
-            inputs=None,
-            outputs=[]
         )
 
         # (İkincil) 💾 Referans Şarkı Sözlerini Güncelle Butonu
         save_button.click(
-            fn=lambda: gr.Info("Referans şarkı sözleri güncelleme başladı..."), # Başlangıç mesajı
-            inputs=None,
-            outputs=[]
-        ).then(
-            fn=save_fetched_lyrics_callback,
+            fn=with_toasts(
+                save_fetched_lyrics_callback,
+                "Referans şarkı sözleri güncelleme başladı...",
+                "Referans şarkı sözleri güncelleme tamamlandı!"
+            ),
             inputs=[
                 fetched_lyrics_box,
                 state_working_dir,
                 state_fetched_lyrics_json,
-                state_fetched_lyrics_display
+                state_fetched_lyrics_display,
+                state_cache_dir
             ],
             outputs=[
                 state_fetched_lyrics_json,
                 state_fetched_lyrics_display
-            ]
+            ],
+            concurrency_limit=8,
+            concurrency_id="io"
         ).then(
             fn=check_modify_ai_availability,
             inputs=[state_working_dir],
             outputs=modify_button
-        ).then(
-            fn=lambda: gr.Info("Referans şarkı sözleri güncelleme tamamlandı!"), # Bitiş mesajı
-            inputs=None,
-            outputs=[]
         )
 
         # Modify butonu için güncelleme
         modify_button.click(
-            fn=lambda: gr.Info("AI ile düzenleme başladı..."), # Başlangıç mesajı
-            inputs=None,
-            outputs=[]
-        ).then(
-            fn=modify_lyrics_callback,
+            fn=with_toasts(modify_lyrics_callback, "AI ile düzenleme başladı...", "AI ile düzenleme tamamlandı!"),
             inputs=[
                 force_ai_modification,
                 state_working_dir,
                 state_lyrics_json,
                 state_lyrics_display
             ],
+            # Her AI parçasından sonra kısmi sonuç doğrudan metin kutusuna akar
             outputs=[
                 state_lyrics_json,
-                state_lyrics_display
-            ]
-        ).then(
-            fn=lambda disp: disp,
-            inputs=state_lyrics_display,
-            outputs=raw_lyrics_box
+                state_lyrics_display,
+                raw_lyrics_box
+            ],
+            concurrency_limit=8,
+            concurrency_id="io"
         ).then(
             fn=check_generate_karaoke_availability,
             inputs=[state_working_dir],
@@ -567,10 +571,6 @@ def main_app(cache_dir, fonts_dir, output_dir, project_root):
             fn=update_lyrics_timing_editor,
             inputs=[state_working_dir, state_lyrics_json],
             outputs=[lyrics_timing_df, save_timing_button]
-        ).then(
-            fn=lambda: gr.Info("AI ile düzenleme tamamlandı!"), # Bitiş mesajı
-            inputs=None,
-            outputs=[]
         )
 
         # Zaman Düzenleme butonunu Ekle
@@ -591,17 +591,14 @@ def main_app(cache_dir, fonts_dir, output_dir, project_root):
         save_timing_button.click(
             fn=save_timing_changes,
             inputs=[lyrics_timing_df, state_working_dir, state_lyrics_json],
-            outputs=[state_lyrics_json, timing_status]
+            outputs=[state_lyrics_json, timing_status],
+            concurrency_limit=8,
+            concurrency_id="io"
         ).then(
-            # Kullanıcıya bilgi ver
-            fn=lambda: "Zaman düzeltmeleri kaydediliyor ve ASS dosyası güncelleniyor...",
+            # Kullanıcıya bilgi ver ve ASS dosyasını zorla yeniden oluşturmak için butonu True olarak ayarla
+            fn=lambda: ("Zaman düzeltmeleri kaydediliyor ve ASS dosyası güncelleniyor...", True),
             inputs=[],
-            outputs=[timing_status]
-        ).then(
-            # ASS dosyasını zorla yeniden oluşturmak için butonu True olarak ayarla
-            fn=lambda: True,
-            inputs=[],
-            outputs=[force_subtitles_overwrite]
+            outputs=[timing_status, force_subtitles_overwrite]
         ).then(
             # ASS dosyasını oluştur
             fn=process_karaoke_subtitles,
@@ -633,16 +630,16 @@ def main_app(cache_dir, fonts_dir, output_dir, project_root):
 
         # (Birincil) Karaoke Oluştur Butonu
         generate_karaoke_button.click(
-            fn=lambda: gr.Info("Karaoke oluşturma başladı..."), # Başlangıç mesajı
-            inputs=None,
-            outputs=[]
-        ).then(
             # Butona basıldığında force_subtitles_overwrite'i True yapalım 
             fn=lambda: True,
             inputs=[],
             outputs=[force_subtitles_overwrite]
         ).then(
-            fn=generate_subtitles_and_video_callback,
+            fn=with_toasts(
+                generate_subtitles_and_video_callback,
+                "Karaoke oluşturma başladı...",
+                "Karaoke oluşturma tamamlandı!"
+            ),
             inputs=[
                 state_working_dir,
                 font_input,
@@ -665,14 +662,14 @@ def main_app(cache_dir, fonts_dir, output_dir, project_root):
                 audio_bitrate_input,
                 force_subtitles_overwrite,
                 edit_ass_before_render,
-                gr.State(output_dir),
-                gr.State(effects_dir)
+                state_output_dir,
+                state_effects_dir
             ],
-            outputs=[karaoke_video_output]
-        ).then(
-            fn=lambda: gr.Info("Karaoke oluşturma tamamlandı!"), # Bitiş mesajı
-            inputs=None,
-            outputs=[]
+            outputs=[karaoke_video_output],
+            concurrency_limit=1,
+            concurrency_id="gpu"
         )
 
-        return app
+    # Hafif geri aramalar ağır ses/video işlerinin arkasında beklemez
+    app.queue(default_concurrency_limit=4, max_size=32)
+    return app
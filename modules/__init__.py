@@ -13,7 +13,9 @@ from .stem_processing import (
 from .lyrics_processing import (
     transcribe_audio_lyrics,
     fetch_and_save_lyrics,
-    perform_lyric_enhancement
+    update_cached_lyrics,
+    perform_lyric_enhancement,
+    stream_lyric_enhancement
 )
 
 from .subtitle_processing import (
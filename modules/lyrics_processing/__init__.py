@@ -1,3 +1,3 @@
 from .extract_lyrics import transcribe_audio_lyrics
-from .search_lyrics import fetch_and_save_lyrics
-from .modify_lyrics import perform_lyric_enhancement
\ No newline at end of file
+from .search_lyrics import fetch_and_save_lyrics, update_cached_lyrics
+from .modify_lyrics import perform_lyric_enhancement, stream_lyric_enhancement
\ No newline at end of file
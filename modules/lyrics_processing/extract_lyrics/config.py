@@ -1,6 +1,13 @@
+# Standard Library Imports
+import os
+
 # Third-Party Imports
 import torch
 
 DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
 COMPUTE_TYPE = "float16" if DEVICE == "cuda" else "int8"
-MODEL_SIZE = "large-v3"
\ No newline at end of file
+MODEL_SIZE = "large-v3"
+
+# faster-whisper >= 1.1.0 BatchedInferencePipeline (VAD segmentlerini toplu çözer)
+BATCHED_INFERENCE = os.getenv("WHISPER_BATCHED", "0").lower() in ("1", "true", "yes")
+BATCH_SIZE = int(os.getenv("WHISPER_BATCH_SIZE", "16"))
@@ -2,20 +2,35 @@
 from pathlib import Path
 from typing import Union
 import logging
+import re
 
 # Third-Party Imports
 from faster_whisper import WhisperModel
 
 # Local Application Imports
-from .config import MODEL_SIZE, DEVICE, COMPUTE_TYPE
+from .config import MODEL_SIZE, DEVICE, COMPUTE_TYPE, BATCHED_INFERENCE, BATCH_SIZE
 from interface.helpers import get_available_languages
 
 # Initialize Whisper model globally to avoid reloading it multiple times
 MODEL = WhisperModel(MODEL_SIZE, device=DEVICE, compute_type=COMPUTE_TYPE)
 
+# Optional batched pipeline (WHISPER_BATCHED=1); it only exists in faster-whisper >= 1.1.0
+BATCHED_MODEL = None
+if BATCHED_INFERENCE:
+    from faster_whisper import BatchedInferencePipeline
+    BATCHED_MODEL = BatchedInferencePipeline(model=MODEL)
+
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
+# İstenmeyen ifadeler tek bir derlenmiş alternasyonla, metin üzerinde tek geçişte aranır
+UNWANTED_PHRASES = ('abone ol', 'altyazı', 'm.k.', 'yorum yap', 'beğen butonuna', 'tıklamayı unutmayın')
+_UNWANTED_RE = re.compile('|'.join(map(re.escape, UNWANTED_PHRASES)))
+
+# Intro'daki anlamsız sesler (alt dize olarak eşleşir, önceki `in` kontrolüyle aynı)
+NOISE_PATTERNS = ("ahh", "hah", "hayy", "hmm", "oh", "huh", "yeah", "woo", "woah", "hey", "heya", "oohh")
+_NOISE_RE = re.compile('|'.join(map(re.escape, NOISE_PATTERNS)))
+
 def apply_dtw_correction(word_times, mfcc):
     """
     DTW (Dynamic Time Warping) algoritması kullanarak kelime zamanlarını düzeltir.
@@ -33,128 +48,58 @@ def apply_dtw_correction(word_times, mfcc):
     # Gerçek DTW uygulaması burada yapılabilir.
     return word_times
 
-def filter_lyrics(verses):
+def _is_early_vocal(verse, verse_text, threshold_seconds=15.0, min_word_count=4):
     """
-    Filters out verses containing unwanted phrases.
-    
-    Args:
-        verses (list[dict]): List of verses with text and metadata.
-        
-    Returns:
-        list[dict]: Filtered list of verses.
+    Tek bir verse'ün şarkı başındaki arka vokal / intro sesi olup olmadığını söyler.
+    `verse_text` verse'ün küçük harfli tam metnidir.
     """
-    unwanted_phrases = ['abone ol', 'altyazı', 'm.k.', 'yorum yap','beğen butonuna','tıklamayı unutmayın']
-    filtered_verses = []
-    
-    for verse in verses:
-        # Reconstruct the full text from all words in the verse
-        full_text = ' '.join([word_data['word'] for word_data in verse['words']])
-        full_text_lower = full_text.lower()
-        
-        # Check if any unwanted phrase exists in the text
-        should_include = True
-        for phrase in unwanted_phrases:
-            if phrase in full_text_lower:
-                should_include = False
-                break
-        
-        # If no unwanted phrases found, include this verse
-        if should_include:
-            filtered_verses.append(verse)
-    
-    return filtered_verses
-
-def filter_early_vocals(verses, threshold_seconds=15.0, min_word_count=4):
-    """
-    Şarkının başındaki ilk birkaç saniyedeki arka vokalleri veya sesleri filtrele.
-    Genellikle intro sırasında duyulan "hadi, gel, hey" gibi sesleri çıkarır.
-    
-    Args:
-        verses (list[dict]): Açıklamalı verse'lerin listesi.
-        threshold_seconds (float): Başta dikkate alınmayacak süre (saniye).
-        min_word_count (int): Filtreleme için geçerli bir verse için minimum kelime sayısı.
-        
-    Returns:
-        list[dict]: Filtre sonrası kalan verse'lerin listesi.
-    """
-    if not verses:
-        return []
-    
-    # Eğer verses boş değilse, başlangıç zamanını al
-    filtered_verses = []
-    
-    # Her verse için
-    for verse in verses:
-        # Şarkının başındaki eşik değerinden önce mi?
-        if verse["start"] < threshold_seconds:
-            # Kısa ve başta ise (muhtemelen arka ses veya intro), kontrol et
-            # Kelime sayısı çok azsa, muhtemelen arka vokal
-            if len(verse["words"]) < min_word_count:
-                logger.debug(f"Filtering out early verse at {verse['start']}s with {len(verse['words'])} words")
-                continue
-                
-            # Eğer kelime sayısı yeterliyse bile ama 10 saniyeden önce başlıyorsa 
-            # ve kısa süre devam ediyorsa (intro/solo scream, hay, hey, vs. gibi) hala filtrele
-            if verse["start"] < 10.0 and (verse["end"] - verse["start"]) < 2.0:
-                logger.debug(f"Filtering out early short-duration verse at {verse['start']}s with duration {verse['end'] - verse['start']:.2f}s")
-                continue
-                
-            # Sözlerin içeriğine bak, anlamsız sesleri filtrele
-            verse_text = " ".join([word["word"] for word in verse["words"]]).lower()
-            noise_patterns = ["ahh", "hah", "hayy", "hmm", "oh", "huh", "yeah", "woo", "woah", "hey", "heya", "oohh"]
-            
-            if any(pattern in verse_text for pattern in noise_patterns) and verse["start"] < 10.0:
-                logger.debug(f"Filtering out early noise-like verse at {verse['start']}s: '{verse_text}'")
-                continue
-        
-        # Eşikten sonra veya yeterince kelime içeren verse'leri kabul et
-        filtered_verses.append(verse)
-    
-    return filtered_verses
-
-def filter_short_verses(verses, min_duration=0.5, min_word_count=2):
-    """
-    Çok kısa verse'leri filtrele. Bu genellikle arka vokalleri veya hatalı algılanmış sesleri temsil eder.
-    
-    Args:
-        verses (list[dict]): Verse'lerin listesi.
-        min_duration (float): Minimum verse süresi (saniye).
-        min_word_count (int): Minimum kelime sayısı.
-        
-    Returns:
-        list[dict]: Filtre sonrası kalan verse'lerin listesi.
-    """
-    if not verses:
-        return []
-    
-    filtered_verses = []
-    
-    for verse in verses:
-        # Verse süresi kontrolü
-        duration = verse["end"] - verse["start"]
-        
-        # Çok kısa verse mi?
-        if duration < min_duration:
-            logger.debug(f"Filtering out short verse at {verse['start']}s with duration {duration:.2f}s")
-            continue
-            
-        # Çok az kelime içeriyor mu?
-        if len(verse["words"]) < min_word_count:
-            logger.debug(f"Filtering out verse at {verse['start']}s with only {len(verse['words'])} words")
-            continue
-        
-        # Yeterince uzun verse'leri kabul et
-        filtered_verses.append(verse)
-    
-    return filtered_verses
+    # Şarkının başındaki eşik değerinden sonra ise kabul et
+    if verse["start"] >= threshold_seconds:
+        return False
+
+    # Kısa ve başta ise (muhtemelen arka ses veya intro), kontrol et
+    # Kelime sayısı çok azsa, muhtemelen arka vokal
+    if len(verse["words"]) < min_word_count:
+        logger.debug(f"Filtering out early verse at {verse['start']}s with {len(verse['words'])} words")
+        return True
+
+    if verse["start"] < 10.0:
+        # Eğer kelime sayısı yeterliyse bile ama 10 saniyeden önce başlıyorsa 
+        # ve kısa süre devam ediyorsa (intro/solo scream, hay, hey, vs. gibi) hala filtrele
+        if (verse["end"] - verse["start"]) < 2.0:
+            logger.debug(f"Filtering out early short-duration verse at {verse['start']}s with duration {verse['end'] - verse['start']:.2f}s")
+            return True
+
+        # Sözlerin içeriğine bak, anlamsız sesleri filtrele
+        if _NOISE_RE.search(verse_text) is not None:
+            logger.debug(f"Filtering out early noise-like verse at {verse['start']}s: '{verse_text}'")
+            return True
+
+    return False
+
+def _is_short_verse(verse, min_duration=0.5, min_word_count=2):
+    """Tek bir verse'ün çok kısa ya da çok az kelimeli olup olmadığını söyler."""
+    # Verse süresi kontrolü
+    duration = verse["end"] - verse["start"]
+
+    # Çok kısa verse mi?
+    if duration < min_duration:
+        logger.debug(f"Filtering out short verse at {verse['start']}s with duration {duration:.2f}s")
+        return True
+
+    # Çok az kelime içeriyor mu?
+    if len(verse["words"]) < min_word_count:
+        logger.debug(f"Filtering out verse at {verse['start']}s with only {len(verse['words'])} words")
+        return True
+
+    return False
 
 def post_process_sync(verses, audio_path):
     """
     DTW algoritması kullanarak senkronizasyonu düzeltir
     """
+    # librosa kurulu bağımlılıklar arasında değil; yalnızca bu yardımcı kullanıldığında yüklenir
     import librosa
-    import numpy as np
-    from fastdtw import fastdtw
     
     # Ses dosyasını yükle
     y, sr = librosa.load(audio_path)
@@ -183,7 +128,7 @@ def post_process_sync(verses, audio_path):
     
     return verses
 
-def _extract_lyrics_with_timing(
+def _iter_lyrics_with_timing(
         audio_path: Union[str, Path],
         beam_size_input: int = 15,
         best_of_input: int = 5,
@@ -194,13 +139,14 @@ def _extract_lyrics_with_timing(
         language_option: str = "Auto Detect"
     ):
     """
-    Extracts and groups lyrics into verses with timing and word details.
+    Extracts and groups lyrics into verses with timing and word details,
+    yielding each verse that passes the filters as soon as Whisper decodes its segment.
 
     Args:
         audio_path (str): Path to the audio file.
 
-    Returns:
-        list[dict]: List of verses with text and metadata.
+    Yields:
+        dict: Verse with text and metadata.
     """
     # If the user chooses Auto Detect, we let Whisper decide (or pass None)
     if language_option == "Auto Detect":
@@ -209,9 +155,18 @@ def _extract_lyrics_with_timing(
         available_langs = get_available_languages()
         lang = available_langs.get(language_option, None)
 
+    # Batched decoding runs the VAD segments through the model together
+    if BATCHED_MODEL is not None:
+        transcribe = BATCHED_MODEL.transcribe
+        batch_kwargs = {"batch_size": BATCH_SIZE}
+    else:
+        transcribe = MODEL.transcribe
+        batch_kwargs = {}
+
     # Transcribe the audio and extract word-level timestamps
-    segments, info = MODEL.transcribe(
-        audio_path,
+    segments, info = transcribe(
+        str(audio_path),
+        **batch_kwargs,
         word_timestamps=True,              # Extract word-level timestamps
         beam_size=int(beam_size_input),    # Increase beam search for better word accuracy
         best_of=int(best_of_input),        # Pick the best transcription from multiple runs
@@ -228,12 +183,10 @@ def _extract_lyrics_with_timing(
         )
     )
 
-    logger.debug(f"Transcription of the vocals audio segments completed.")
-
-    # Initialize an empty list to hold the processed verses
-    verses = []
+    # Filtre başına elenen verse sayıları (özet debug logu için)
+    filtered_unwanted = filtered_early = filtered_short = 0
 
-    # Process each segment into a structured verse
+    # Process each segment into a structured verse as Whisper decodes it
     logger.debug(f"Formatting segments into verses with words, timing, and predictions using the Whisper model.")
     for segment in segments:
 
@@ -256,20 +209,39 @@ def _extract_lyrics_with_timing(
             "words": words_metadata       # Word-level metadata
         }
 
-        # Append the verse metadata to the list of verses
-        verses.append(verse_data)
+        # Filtrele: istenmeyen kelimeleri içeren dizeleri çıkar (derlenmiş desenle tek geçişte)
+        verse_text = ' '.join([word_data['word'] for word_data in words_metadata]).lower()
+        if _UNWANTED_RE.search(verse_text) is not None:
+            logger.debug(f"Filtering out verse at {verse_data['start']}s containing an unwanted phrase")
+            filtered_unwanted += 1
+            continue
 
-    # Filtrele: istenmeyen kelimeleri içeren dizeleri çıkar
-    verses = filter_lyrics(verses)
-    logger.debug(f"Filtered out verses containing unwanted phrases. {len(verses)} verses remaining.")
-    
-    # Şarkının başındaki erken sesleri filtrele
-    verses = filter_early_vocals(verses)
-    logger.debug(f"Filtered out early verses that might be background vocals. {len(verses)} verses remaining.")
-    
-    # Çok kısa verse'leri filtrele (arka vokaller veya hatalar)
-    verses = filter_short_verses(verses)
-    logger.debug(f"Filtered out very short verses that might be errors. {len(verses)} verses remaining.")
-    
+        # Şarkının başındaki erken sesleri filtrele
+        if _is_early_vocal(verse_data, verse_text):
+            filtered_early += 1
+            continue
+
+        # Çok kısa verse'leri filtrele (arka vokaller veya hatalar)
+        if _is_short_verse(verse_data):
+            filtered_short += 1
+            continue
+
+        yield verse_data
+
+    logger.debug(f"Transcription of the vocals audio segments completed.")
+    logger.debug(f"Filtered out {filtered_unwanted} verses containing unwanted phrases.")
+    logger.debug(f"Filtered out {filtered_early} early verses that might be background vocals.")
+    logger.debug(f"Filtered out {filtered_short} very short verses that might be errors.")
+
+
+def _extract_lyrics_with_timing(*args, **kwargs):
+    """
+    Extracts and groups lyrics into verses with timing and word details.
+    Takes the same arguments as `_iter_lyrics_with_timing`.
+
+    Returns:
+        list[dict]: List of verses with text and metadata.
+    """
+    verses = list(_iter_lyrics_with_timing(*args, **kwargs))
     logger.debug(f"Transcribed {len(verses)} verses with words, timing, and predictions using the Whisper model.")
-    return verses
\ No newline at end of file
+    return verses
@@ -1 +1 @@
-from .process import perform_lyric_enhancement
\ No newline at end of file
+from .process import perform_lyric_enhancement, stream_lyric_enhancement
\ No newline at end of file
@@ -127,9 +127,12 @@ def _validate_and_parse_response(cleaned_content):
         raise RuntimeError("Failed to decode JSON response.") from je
 
 
-def _process_lyrics_in_chunks(raw_lyrics, reference_lyrics, chunk_size=50):
+def _iter_lyrics_in_chunks(raw_lyrics, reference_lyrics, chunk_size=50):
     """
     Processes raw lyrics in chunks, aligning them with corrected lyrics.
+
+    Yields the aligned lyrics accumulated so far after every processed chunk,
+    so callers can show partial results while the remaining chunks are sent to the LLM.
     """
     # Split raw lyrics into smaller chunks: List[List[dict]]
     chunks = _chunk_lyrics(raw_lyrics, chunk_size)
@@ -214,6 +217,17 @@ def _process_lyrics_in_chunks(raw_lyrics, reference_lyrics, chunk_size=50):
             logger.error(f"Error processing chunk {chunk_number}: {e}")
             raise e
 
+        yield aligned_lyrics
+
+
+def _process_lyrics_in_chunks(raw_lyrics, reference_lyrics, chunk_size=50):
+    """
+    Processes raw lyrics in chunks, aligning them with corrected lyrics.
+    """
+    aligned_lyrics = []
+    for aligned_lyrics in _iter_lyrics_in_chunks(raw_lyrics, reference_lyrics, chunk_size):
+        pass
+
     logger.info("Modified lyrics successfully processed in chunks!")
 
     return aligned_lyrics
\ No newline at end of file
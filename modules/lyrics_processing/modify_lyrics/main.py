@@ -4,7 +4,7 @@ from pprint import pprint
 
 # Local Application Imports
 from .lyrics_cleaning import _condense_raw_lyrics, _expand_gemini_lyrics
-from .lyrics_processor import _process_lyrics_in_chunks
+from .lyrics_processor import _iter_lyrics_in_chunks
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -15,7 +15,8 @@ def _modify_lyrics_ai(raw_lyrics, reference_lyrics):
     Modifies raw lyrics using AI by aligning them with official lyrics.
 
     This function condenses the raw lyrics, processes them in chunks, and formats
-    the modified lyrics to match the official lyrics.
+    the modified lyrics to match the official lyrics. It drains `_iter_modify_lyrics_ai`
+    and returns its final result.
 
     Args:
         raw_lyrics (list): List of raw transcribed lyrics.
@@ -24,6 +25,27 @@ def _modify_lyrics_ai(raw_lyrics, reference_lyrics):
     Returns:
         list: Formatted and modified lyrics.
     """
+    formatted_modified_lyrics = []
+    for formatted_modified_lyrics in _iter_modify_lyrics_ai(raw_lyrics, reference_lyrics):
+        pass
+
+    return formatted_modified_lyrics
+
+
+def _iter_modify_lyrics_ai(raw_lyrics, reference_lyrics):
+    """
+    Streaming variant of `_modify_lyrics_ai`.
+
+    Yields the formatted (verse-structured) lyrics aligned so far after every
+    AI chunk, ending with the complete result.
+
+    Args:
+        raw_lyrics (list): List of raw transcribed lyrics.
+        reference_lyrics (list): List of official lyrics (verses as strings).
+
+    Yields:
+        list: Formatted and modified lyrics processed so far.
+    """
     try:
         # Step 1: Condense raw lyrics into a simpler structure for processing
         compressed_raw_lyrics = _condense_raw_lyrics(raw_lyrics)
@@ -37,16 +59,15 @@ def _modify_lyrics_ai(raw_lyrics, reference_lyrics):
         ]
         logger.debug(f"Compressed official lyrics for processing through AI | {len(compressed_reference_lyrics)} words")
 
-        # Step 3: Process the lyrics in chunks and align them
-        modified_lyrics = _process_lyrics_in_chunks(compressed_raw_lyrics, compressed_reference_lyrics)
-        logger.debug(f"Lyrics successfully processed through AI | {len(modified_lyrics)} words")
+        # Step 3: Process the lyrics in chunks and align them, expanding each partial
+        # result back to the original verse structure (Step 4)
+        modified_lyrics = []
+        for modified_lyrics in _iter_lyrics_in_chunks(compressed_raw_lyrics, compressed_reference_lyrics):
+            yield _expand_gemini_lyrics(modified_lyrics)
 
-        # Step 4: Expand the processed lyrics back to the original verse structure
-        formatted_modified_lyrics = _expand_gemini_lyrics(modified_lyrics)
+        logger.debug(f"Lyrics successfully processed through AI | {len(modified_lyrics)} words")
         logger.debug(f"Lyrics format successfully expanded back to original structure")
 
-        return formatted_modified_lyrics
-
     except Exception as e:
         logger.error(f"Error during lyrics modification: {e}")
-        raise
\ No newline at end of file
+        raise
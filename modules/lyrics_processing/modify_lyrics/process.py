@@ -4,7 +4,7 @@ from typing import Union
 import logging
 
 # Local Application Imports
-from .main import _modify_lyrics_ai
+from .main import _iter_modify_lyrics_ai
 from ...utilities import load_json, save_json
 
 # Initialize Logger
@@ -21,7 +21,31 @@ def perform_lyric_enhancement(
 
     This function checks for the existence of required input files (`reference_lyrics.json`
     and `raw_lyrics.json`) and skips processing if the output file already exists
-    unless the override flag is set.
+    unless the override flag is set. It drains `stream_lyric_enhancement`.
+
+    Args:
+        output_path (Union[str, Path]): Directory to save the modified lyrics.
+        override (bool): Whether to override the file if it already exists.
+        file_name (str): Name of the output file to save the modified lyrics.
+    """
+    output_file = None
+    for _, output_file in stream_lyric_enhancement(output_path, override, file_name):
+        pass
+
+    return output_file
+
+
+def stream_lyric_enhancement(
+    output_path: Union[str, Path],
+    override: bool = False,
+    file_name: str = "modified_lyrics.json",
+):
+    """
+    Streaming variant of `perform_lyric_enhancement`.
+
+    Yields `(lyrics, output_file)` tuples: partial lyrics with `output_file=None`
+    after every AI chunk, then the final lyrics together with the saved file path.
+    Yields nothing if the required input files are missing.
 
     Args:
         output_path (Union[str, Path]): Directory to save the modified lyrics.
@@ -35,7 +59,8 @@ def perform_lyric_enhancement(
             logger.info(
                 f"Skipping lyrics modification... AI modified lyrics file already exists in the output directory."
             )
-            return output_file
+            yield load_json(output_file), output_file
+            return
 
         # Step 2: Ensure required input files exist
         raw_lyrics_file = Path(output_path) / "raw_lyrics.json"
@@ -55,13 +80,16 @@ def perform_lyric_enhancement(
         reference_lyrics = load_json(reference_lyrics_file)
 
         # Step 4: Modify the lyrics using the AI
-        modified_lyrics = _modify_lyrics_ai(raw_lyrics, reference_lyrics)
+        # Her AI parçasından sonra o ana kadar hizalanan sözler iletilir
+        modified_lyrics = []
+        for modified_lyrics in _iter_modify_lyrics_ai(raw_lyrics, reference_lyrics):
+            yield modified_lyrics, None
 
         # Step 5: Save the modified lyrics to the output file
         save_json(modified_lyrics, output_file)
         logger.info("Lyrics ai modification completed and saved successfully!")
-        return output_file
+        yield modified_lyrics, output_file
 
     except Exception as e:
         logger.error(f"Error during lyrics modification process: {e}")
-        raise
\ No newline at end of file
+        raise
@@ -1 +1 @@
-from .process import fetch_and_save_lyrics
\ No newline at end of file
+from .process import fetch_and_save_lyrics, update_cached_lyrics
\ No newline at end of file
@@ -1,4 +1,7 @@
 # Standard Library Imports
+from pathlib import Path
+from typing import Union
+import hashlib
 import logging
 import re
 
@@ -59,3 +62,23 @@ def _fetch_official_lyrics(metadata):
     except Exception as e:
         logger.error(f"Error fetching lyrics: {e}")
         raise RuntimeError(f"Error fetching lyrics: {e}")
+
+
+def _get_lyrics_cache_file(cache_dir: Union[str, Path], metadata: dict) -> Path:
+    """
+    Build the path of the shared on-disk lyrics cache entry for a song.
+
+    The key is a SHA-1 of the lowercased "artist|title", so the same song processed
+    from different audio files (different working directories) reuses one fetch.
+
+    Args:
+        cache_dir (Union[str, Path]): Root cache directory of the application.
+        metadata (dict): Song metadata with `title` and `artists` keys.
+
+    Returns:
+        Path: `<cache_dir>/lyrics_cache/<sha1>.json`
+    """
+    artists = metadata["artists"]
+    artist = ", ".join(artists) if isinstance(artists, list) else artists
+    key = hashlib.sha1(f"{artist.lower()}|{metadata['title'].lower()}".encode("utf-8")).hexdigest()
+    return Path(cache_dir) / "lyrics_cache" / f"{key}.json"
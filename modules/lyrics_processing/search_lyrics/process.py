@@ -1,11 +1,11 @@
 # Standard Library Imports
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 import logging
 
 # Local Application Imports
-from .main import _fetch_official_lyrics
-from ...utilities import load_json, save_json
+from .main import _fetch_official_lyrics, _get_lyrics_cache_file
+from ...utilities import load_json, save_json, ensure_directory_exists
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -14,6 +14,7 @@ def fetch_and_save_lyrics(
     output_path: Union[str, Path],
     override: bool = False,
     file_name: str = "reference_lyrics.json",
+    cache_dir: Optional[Union[str, Path]] = None,
 ):
     """
     Process the lyric search and save the fetched lyrics to a file.
@@ -22,6 +23,9 @@ def fetch_and_save_lyrics(
         output_path (Union[str, Path]): Directory to save the fetched lyrics.
         override (bool): Whether to override the file if it already exists.
         file_name (str): Name of the output file to save the lyrics.
+        cache_dir (Optional[Union[str, Path]]): If given, fetched lyrics are also kept in
+            `<cache_dir>/lyrics_cache/` keyed by artist and title, and reused for the same
+            song unless `override` is set.
     """
     metadata_file = Path(output_path) / "metadata.json"
 
@@ -44,8 +48,18 @@ def fetch_and_save_lyrics(
         # Load the audio metadata file
         metadata = load_json(metadata_file)
 
-        # Fetch official lyrics
-        lyrics = _fetch_official_lyrics(metadata)
+        # Reuse lyrics already fetched for the same song, unless a refetch is forced
+        cache_file = _get_lyrics_cache_file(cache_dir, metadata) if cache_dir else None
+        if cache_file and cache_file.exists() and not override:
+            logger.info("Using cached official lyrics for this song.")
+            lyrics = load_json(cache_file)
+        else:
+            # Fetch official lyrics
+            lyrics = _fetch_official_lyrics(metadata)
+
+            if cache_file:
+                ensure_directory_exists(cache_file.parent)
+                save_json(lyrics, cache_file)
 
         # Save the lyrics as a JSON file
         save_json(lyrics, output_file)
@@ -55,3 +69,27 @@ def fetch_and_save_lyrics(
     except Exception as e:
         logger.error(f"Error processing lyric search: {e}")
         raise RuntimeError(f"Error processing lyric search: {e}")
+
+
+def update_cached_lyrics(
+    output_path: Union[str, Path],
+    lyrics: list,
+    cache_dir: Optional[Union[str, Path]] = None,
+):
+    """
+    Overwrite the shared lyrics cache entry of a song with user-edited lyrics,
+    so the next fetch without `override` returns the edited version.
+
+    Args:
+        output_path (Union[str, Path]): Working directory containing `metadata.json`.
+        lyrics (list): Edited reference lyrics (verses as strings).
+        cache_dir (Optional[Union[str, Path]]): Root cache directory; nothing is done if not given.
+    """
+    metadata_file = Path(output_path) / "metadata.json"
+    if not cache_dir or not metadata_file.exists():
+        return
+
+    cache_file = _get_lyrics_cache_file(cache_dir, load_json(metadata_file))
+    ensure_directory_exists(cache_file.parent)
+    save_json(lyrics, cache_file)
+    logger.info("Cached official lyrics updated with the edited version.")
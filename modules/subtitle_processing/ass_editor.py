@@ -1,9 +1,11 @@
 # Standard Library Imports
 from pathlib import Path
 from typing import Union, Optional, List
+import io
 import logging
 import os
 import re
+import shutil
 import tempfile
 import subprocess
 import sys
@@ -12,37 +14,45 @@ import time
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
-def read_ass_file(file_path: Union[str, Path]) -> List[str]:
+# Önizleme için satır desenleri (içerik tek metin olarak taranır)
+_DIALOGUE_LINE_RE = re.compile(r'^Dialogue:.*$', re.MULTILINE)
+_STYLE_LINE_RE = re.compile(r'^.*Style:.*$', re.MULTILINE)
+
+def read_ass_file(file_path: Union[str, Path], readlines: bool = False) -> Union[str, List[str]]:
     """
-    ASS dosyasının içeriğini satır satır okur ve bir liste olarak döndürür.
+    ASS dosyasının içeriğini tek bir read() çağrısıyla okur.
     
     Args:
         file_path: ASS dosyasının yolu
+        readlines: True ise içerik satır listesi olarak döndürülür
         
     Returns:
-        List[str]: ASS dosyasının satırlarını içeren liste
+        Union[str, List[str]]: ASS dosyasının içeriği (veya satırlarını içeren liste)
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
-            return file.readlines()
+            return file.readlines() if readlines else file.read()
     except Exception as e:
         logger.error(f"ASS dosyası okuma hatası: {e}")
-        return []
+        return [] if readlines else ""
 
-def write_ass_file(file_path: Union[str, Path], content: List[str]) -> bool:
+def write_ass_file(file_path: Union[str, Path], content: Union[str, List[str]]) -> bool:
     """
     İçeriği ASS dosyasına yazar.
     
     Args:
         file_path: ASS dosyasının yolu
-        content: Yazılacak satırların listesi
+        content: Yazılacak içerik (tek metin veya satırların listesi)
         
     Returns:
         bool: İşlem başarılı ise True, değilse False
     """
     try:
         with open(file_path, 'w', encoding='utf-8') as file:
-            file.writelines(content)
+            if isinstance(content, str):
+                file.write(content)
+            else:
+                file.writelines(content)
         return True
     except Exception as e:
         logger.error(f"ASS dosyası yazma hatası: {e}")
@@ -59,14 +69,22 @@ def create_temporary_ass_copy(original_path: Union[str, Path]) -> Optional[str]:
         Optional[str]: Geçici dosyanın yolu, hata durumunda None
     """
     try:
-        original_content = read_ass_file(original_path)
-        if not original_content:
+        # Boş dosya için kopya oluşturulmaz
+        if os.stat(original_path).st_size == 0:
             return None
             
         temp_dir = tempfile.gettempdir()
         temp_file = os.path.join(temp_dir, f"temp_edit_{os.path.basename(original_path)}")
         
-        if write_ass_file(temp_file, original_content):
+        # Dosya çözümlenmeden doğrudan çekirdek düzeyinde kopyalanır
+        try:
+            shutil.copyfile(original_path, temp_file)
+            return temp_file
+        except OSError as e:
+            logger.warning(f"Doğrudan kopyalama başarısız, içerik okunup yazılacak: {e}")
+        
+        original_content = read_ass_file(original_path)
+        if original_content and write_ass_file(temp_file, original_content):
             return temp_file
             
         return None
@@ -85,8 +103,11 @@ def open_with_default_app(file_path: Union[str, Path]) -> bool:
         bool: İşlem başarılı ise True, değilse False
     """
     try:
-        file_path = Path(file_path).resolve()
-        if not file_path.exists():
+        # Tek bir stat çağrısıyla varlık kontrolü; açıcılar göreli yolu da kabul eder
+        file_path = os.fspath(file_path)
+        try:
+            os.stat(file_path)
+        except FileNotFoundError:
             logger.error(f"Dosya bulunamadı: {file_path}")
             return False
             
@@ -181,36 +202,34 @@ def preview_ass_content(ass_file_path: Union[str, Path], max_lines: int = 20) ->
         if not content:
             return "Dosya içeriği okunamadı"
             
-        # Dialogue: satırlarını bul
-        dialogue_lines = [line for line in content if line.startswith("Dialogue:")]
-        style_lines = [line for line in content if "Style:" in line]
+        # Dialogue: ve stil satırlarını tek taramada bul
+        dialogue_lines = _DIALOGUE_LINE_RE.findall(content)
+        style_lines = _STYLE_LINE_RE.findall(content)
         
-        # Önizleme içeriği oluştur
-        preview_lines = []
+        # Önizleme içeriği tek bir tampona yazılır
+        buf = io.StringIO()
         
         # Stil bilgilerini ekle
         if style_lines:
-            preview_lines.append("# Stil Bilgileri:\n")
-            for i, line in enumerate(style_lines[:5]):
-                preview_lines.append(f"{line.strip()}\n")
+            buf.write("# Stil Bilgileri:\n")
+            buf.writelines(f"{line.strip()}\n" for line in style_lines[:5])
             if len(style_lines) > 5:
-                preview_lines.append(f"... (toplam {len(style_lines)} stil)\n")
+                buf.write(f"... (toplam {len(style_lines)} stil)\n")
         
         # Dialogue satırlarını ekle
         if dialogue_lines:
-            preview_lines.append("\n# Altyazı Satırları:\n")
-            for i, line in enumerate(dialogue_lines[:max_lines]):
-                preview_lines.append(f"{line.strip()}\n")
+            buf.write("\n# Altyazı Satırları:\n")
+            buf.writelines(f"{line.strip()}\n" for line in dialogue_lines[:max_lines])
             if len(dialogue_lines) > max_lines:
-                preview_lines.append(f"... (toplam {len(dialogue_lines)} altyazı satırından {max_lines} tanesi gösteriliyor)\n")
+                buf.write(f"... (toplam {len(dialogue_lines)} altyazı satırından {max_lines} tanesi gösteriliyor)\n")
         
         # Diğer içerik hakkında bilgi
-        total_lines = len(content)
+        total_lines = content.count('\n') + (not content.endswith('\n'))
         shown_lines = len(style_lines) + len(dialogue_lines)
         if total_lines > shown_lines:
-            preview_lines.append(f"\n# Dosya içinde toplam {total_lines} satır bulunuyor.")
+            buf.write(f"\n# Dosya içinde toplam {total_lines} satır bulunuyor.")
             
-        return ''.join(preview_lines)
+        return buf.getvalue()
     except Exception as e:
         logger.error(f"ASS önizleme hatası: {e}")
         return f"ASS dosyası önizleme hatası: {e}"
@@ -1,4 +1,5 @@
 # Third-party imports
+from functools import lru_cache
 import os
 
 def get_font_list(font_directory):
@@ -25,8 +26,12 @@ def get_font_list(font_directory):
 
     return font_dict
 
+@lru_cache(maxsize=1)
 def get_available_colors():
-    """Generate a dictionary of color names and their ASS-compatible codes."""
+    """
+    Generate a dictionary of color names and their ASS-compatible codes.
+    Built once per process; callers must treat the returned dict as read-only.
+    """
     return {
         "White": "&H00FFFFFF",
         "Black": "&H00000000",
@@ -1,5 +1,8 @@
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Union
+import io
 
 # Local Application Imports
 from .config import (get_available_colors, validate_and_get_color)
@@ -8,27 +11,48 @@ from .utilities import get_ass_rounded_rectangle
 # Şarkı başlığının ekranda kalma süresi
 title_duration = 4
 
+# Kelime/satır döngülerinde kullanılan ASS etiket şablonları
+_KF_FMT = "{\\kf%d}%s"
+_FAD_WRAP = "{\\fad(300,0)}%s"
+
+# Normalize edilmiş kelimenin metni (bkz. normalize_word_texts)
+_raw_text = itemgetter('raw')
+
+# 00..99 için hazır iki haneli metinler (format_time'da :02d biçimlendirmesi yerine)
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+
+@lru_cache(maxsize=4096)
+def _format_time_cs(centiseconds: int) -> str:
+    """Santisaniye cinsinden zamanı ASS formatına çevirir (sınırlar olaylar arasında tekrar eder)."""
+    hours, rem = divmod(centiseconds, 360000)
+    minutes, rem = divmod(rem, 6000)
+    secs, cs = divmod(rem, 100)
+    return f"{hours}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[secs]}.{_TWO_DIGITS[cs]}"
+
 def format_time(seconds: float) -> str:
     """
-    Float olarak gelen zamanı ASS formatına çevirir.
-    Örnek: 0:00:05.20
+    Saniye cinsinden süreyi ASS format zamanına dönüştürür: 0:00:00.00
+    
+    Parameters:
+    - seconds: Saniye cinsinden süre
+    
+    Returns:
+    - str: ASS formatında zaman dizgisi
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = seconds % 60
-    return f"{hours}:{minutes:02}:{secs:05.2f}"
+    return _format_time_cs(int(round(seconds * 100)))
+
+def render_section(section_name: str, content: str) -> str:
+    return f"[{section_name}]\n{content}\n"
 
 def write_section(file, section_name: str, content: str):
-    file.write(f"[{section_name}]\n")
-    file.write(content)
-    file.write("\n")
+    file.write(render_section(section_name, content))
 
-def write_script_info(
-    file,
+@lru_cache(maxsize=32)
+def render_script_info(
     title: str = "Karaoke Subtitles",
     screen_width: int = 1280,
     screen_height: int = 720
-):
+) -> str:
     content = (
         f"Title: {title}\n"
         "ScriptType: v4.00+\n"
@@ -36,7 +60,15 @@ def write_script_info(
         f"PlayResY: {screen_height}\n"
         "PlayDepth: 0\n"
     )
-    write_section(file, "Script Info", content)
+    return render_section("Script Info", content)
+
+def write_script_info(
+    file,
+    title: str = "Karaoke Subtitles",
+    screen_width: int = 1280,
+    screen_height: int = 720
+):
+    file.write(render_script_info(title, screen_width, screen_height))
 
 def write_style(
     style_name: str,
@@ -63,8 +95,8 @@ def write_style(
         f"2,0,0,{margin_v},1\n"  # Alignment=2 (merkez), MarginV, Encoding=1
     )
 
-def write_styles(
-    file,
+@lru_cache(maxsize=32)
+def render_styles(
     font: str = "/app/fonts/Futura XBlkCnIt BT.ttf",
     fontsize: int = 60,
     primary_color: str = "&H0000A5FF",  # Turuncu vs. aktif satır rengi
@@ -74,7 +106,11 @@ def write_styles(
     shadow_color: str = "&H00FF8080",
     shadow_size: int = 0,
     screen_height: int = 720,
-):
+) -> str:
+    """
+    [V4+ Styles] bölümünü üretir. Stil ayarları bir iş boyunca sabit
+    olduğundan sonuç aynı parametreler için önbellekten döner.
+    """
     style_content = (
         "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, "
         "OutlineColour, BackColour, "
@@ -128,10 +164,24 @@ def write_styles(
         margin_v=int(screen_height * 0.45),
     )
 
-    write_section(file, "V4+ Styles", style_content)
+    return render_section("V4+ Styles", style_content)
 
-def write_dialogue(
-    file,
+def write_styles(file, **style_kwargs):
+    file.write(render_styles(**style_kwargs))
+
+def normalize_word_texts(verses: list) -> list:
+    """
+    Her kelimeye bir kez `raw` anahtarı ekler (yoksa `word` değeri kullanılır);
+    böylece döngülerde `word.get('raw', word['word'])` araması tekrarlanmaz.
+    Verse'ler yerinde güncellenir ve aynı liste döndürülür.
+    """
+    for verse in verses:
+        for word in verse["words"]:
+            if 'raw' not in word:
+                word['raw'] = word['word']
+    return verses
+
+def format_dialogue(
     start: float,
     end: float,
     text: str,
@@ -140,12 +190,11 @@ def write_dialogue(
     margin_r: int = 0,
     margin_v: int = 0,
     position: str = None
-):
+) -> str:
     """
-    Dialog satırını ASS formatında dosyaya yazar.
+    Dialog satırını ASS formatında metin olarak döndürür.
     
     Parameters:
-    - file: Yazılacak dosya nesnesi
     - start: Başlangıç zamanı (saniye)
     - end: Bitiş zamanı (saniye)
     - text: Diyalog metni
@@ -164,9 +213,14 @@ def write_dialogue(
             # Ekranın alt-orta kısmına yerleştir (\an8)
             text = f"{{\\an8}}{text}"
     
-    file.write(
-        f"Dialogue: 0,{format_time(start)},{format_time(end)},{style},,{margin_l},{margin_r},{margin_v},,{text}\n"
-    )
+    return f"Dialogue: 0,{format_time(start)},{format_time(end)},{style},,{margin_l},{margin_r},{margin_v},,{text}\n"
+
+def write_dialogue(file, *args, **kwargs):
+    """
+    Dialog satırını ASS formatında dosyaya yazar.
+    Parametreler `format_dialogue` ile aynıdır.
+    """
+    file.write(format_dialogue(*args, **kwargs))
 
 def parse_artist_title(text: str):
     """
@@ -195,23 +249,6 @@ def parse_artist_title(text: str):
     
     return artist, song_title
 
-def format_time(seconds: float) -> str:
-    """
-    Saniye cinsinden süreyi ASS format zamanına dönüştürür: 0:00:00.00
-    
-    Parameters:
-    - seconds: Saniye cinsinden süre
-    
-    Returns:
-    - str: ASS formatında zaman dizgisi
-    """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    seconds_int = int(seconds % 60)
-    centiseconds = int((seconds % 1) * 100)
-    
-    return f"{hours}:{minutes:02d}:{seconds_int:02d}.{centiseconds:02d}"
-
 def write_title_event(
     file,
     title: str,
@@ -225,13 +262,15 @@ def write_title_event(
     margin_v = int(screen_height * 0.54)  # Üstten %15 aşağıda
     
     artist, song_title = parse_artist_title(title)
-    text = (
+    text = ''.join([
         # Tam sola yapışık artist satırı (\\an7 = sol-üst hizalama)
-        f"{{\\pos({left_margin},{margin_v})\\an7\\fs{fontsize}\\fn/app/fonts/Futura Md BT Bold.ttf\\b1\\1c&H0C79E3&}}{artist}"
-        "\\N"
+        f"{{\\pos({left_margin},{margin_v})\\an7\\fs{fontsize}\\fn/app/fonts/Futura Md BT Bold.ttf\\b1\\1c&H0C79E3&}}",
+        artist,
+        "\\N",
         # Tam sola yapışık şarkı adı (\\an7 ile aynı x pozisyonunda)
-        f"{{\\pos({left_margin},{margin_v + int(fontsize*1.5)})\\an7\\fs{int(fontsize*0.8)}\\fn/app/fonts/Futura Heavy Italic.ttf\\b0\\1c&HFFFFFF&}}{song_title}"
-    )
+        f"{{\\pos({left_margin},{margin_v + int(fontsize*1.5)})\\an7\\fs{int(fontsize*0.8)}\\fn/app/fonts/Futura Heavy Italic.ttf\\b0\\1c&HFFFFFF&}}",
+        song_title,
+    ])
     write_dialogue(file, 0, title_duration, text, style="Line1")
 
 def extend_last_event(
@@ -258,7 +297,7 @@ def extend_last_event(
 
     last_verse = verses[-1]
     # Son verse’in ham metnini oluştur
-    last_verse_text = ' '.join(word.get('raw', word.get('word')) for word in last_verse["words"])
+    last_verse_text = ' '.join(map(_raw_text, last_verse["words"]))
 
     if "Altyazı M .K." in last_verse_text:
         # Eğer son satırda istenen metin varsa, ilgili bölüm başından videonun sonuna kadar 'Teşekkür Ederiz' yazar
@@ -305,7 +344,7 @@ def split_text_into_chunks(verse, max_chars_per_line=40):
     Her parça en az bir kelime içerir ve kelimeleri bölmez.
     
     Parameters:
-    - verse: Parçalanacak verse sözlük nesnesi (words listesini içerir)
+    - verse: Parçalanacak verse sözlük nesnesi (words listesini içerir, bkz. normalize_word_texts)
     - max_chars_per_line: Bir satırdaki maksimum karakter sayısı
     
     Returns:
@@ -322,7 +361,7 @@ def split_text_into_chunks(verse, max_chars_per_line=40):
     
     for word in verse["words"]:
         # Kelimenin raw metni veya normal metni al
-        word_text = word.get('raw', word['word'])
+        word_text = word['raw']
         word_length = len(word_text) + 1  # +1 boşluk için
         
         # Eğer mevcut chunk boşsa veya yeni kelime eklenince sınırı aşmıyorsa
@@ -346,6 +385,17 @@ def split_text_into_chunks(verse, max_chars_per_line=40):
     
     return chunks
 
+def _karaoke_word_parts(words) -> list:
+    """
+    Her kelime için `{\\kfNN}kelime` parçalarını tek bir liste kavrayışında üretir
+    (NN: kelime süresi, santisaniye, aşağı yuvarlanmış).
+    Kelimelerin `normalize_word_texts` ile hazırlanmış olması gerekir.
+    """
+    return [
+        _KF_FMT % (int((word['end'] - word['start']) * 100), word['raw'])
+        for word in words
+    ]
+
 def format_chunk_text(chunk, add_fade=True, add_loader=False):
     """
     Verilen chunk'ı ASS formatında metin olarak biçimlendirir.
@@ -363,16 +413,14 @@ def format_chunk_text(chunk, add_fade=True, add_loader=False):
     # Loader ekle
     if add_loader:
         loader_kf = 200  # 2 saniyelik efekt (kf birimi ~ 0.01s)
-        text_parts.append(f"{{\\kf{loader_kf}}}➤➤➤➤")
+        text_parts.append(_KF_FMT % (loader_kf, "➤➤➤➤"))
     
     # Kelimeleri ASS formatında ekle
-    for word in chunk["words"]:
-        word_duration_cs = int((word["end"] - word["start"]) * 100)
-        text_parts.append(f"{{\\kf{word_duration_cs}}}{word.get('raw', word['word'])}")
+    text_parts.extend(_karaoke_word_parts(chunk["words"]))
     
     # Fade efekti ekle
     if add_fade:
-        return f"{{\\fad(300,0)}}{' '.join(text_parts)}"
+        return _FAD_WRAP % ' '.join(text_parts)
     else:
         return ' '.join(text_parts)
 
@@ -396,113 +444,71 @@ def write_scrolling_lyrics_events(
     """
     loader_threshold = 5.0  # saniye
 
+    # Tüm dialogue satırları biriktirilip tek seferde yazılır
+    lines = []
+
+    # Tüm zamanlama kararları döngüden önce bir kez hesaplanır; döngü yalnızca
+    # bu listelere bakarak metin üretir.
+    n_verses = len(verses)
+    starts = [verse["start"] for verse in verses]
+    ends = [verse["end"] for verse in verses]
+
+    # loader_before[k]: k. verse öncesinde 5+ saniye boşluk var mı
+    # (ilk verse için her zaman True: öncesinde verse yok, loader gösterilir)
+    loader_before = [True] + [
+        starts[k] - ends[k - 1] >= loader_threshold for k in range(1, n_verses)
+    ]
+    # pair_with_next[k]: k. verse bir sonrakiyle aynı event'te birleştirilebilir mi
+    pair_with_next = [not close for close in loader_before[1:]] + [False]
+    # Çift için loader: karaoke satırı (k+1) ile önceki çiftin karaoke satırı (k-1) arası
+    pair_loader = [True] + [
+        k + 1 < n_verses and starts[k + 1] - ends[k - 1] >= loader_threshold
+        for k in range(1, n_verses)
+    ]
+
+    # "MELODI" yazısı beyaz renkle gösterilir
+    melodi_text = "{\\fad(300,300)\\c&HFFFFFF&}MELODI"
+
     i = 0
-    while i < len(verses):
+    while i < n_verses:
         # Mevcut verse ile bir önceki verse arasında 5+ saniye boşluk varsa "MELODI" göster
-        if i > 0:
-            current_verse = verses[i]
-            prev_verse = verses[i-1]
-            gap = current_verse["start"] - prev_verse["end"]
-            
-            if gap >= loader_threshold:
-                melodi_start = prev_verse["end"] + 0.3  # küçük bir gecikme ekle
-                melodi_end = current_verse["start"] - 0.3  # erken bitir
-                
-                # "MELODI" yazısını beyaz renkle göster
-                melodi_text = "{\\fad(300,300)\\c&HFFFFFF&}MELODI"
-                write_dialogue(file, melodi_start, melodi_end, melodi_text, style="Line2", position="center")
-
-        if i + 1 < len(verses) and verses[i + 1]["start"] - verses[i]["end"] < loader_threshold:
+        if i > 0 and loader_before[i]:
+            melodi_start = ends[i - 1] + 0.3  # küçük bir gecikme ekle
+            melodi_end = starts[i] - 0.3  # erken bitir
+            lines.append(format_dialogue(melodi_start, melodi_end, melodi_text, style="Line2", position="center"))
+
+        if pair_with_next[i]:
             # İki verse'i birleştir
             # even index: plain (original Line1), odd index: karaoke (original Line2)
-            verse_plain = verses[i]
-            verse_karaoke = verses[i + 1]
-
-            # Karaoke efekt için loader kontrolü:
-            if i == 0:
-                add_loader = True
-            else:
-                prev_verse_karaoke = verses[i - 1]  # önceki çiftin karaoke versiyonu
-                gap = verse_karaoke["start"] - prev_verse_karaoke["end"]
-                add_loader = (gap >= loader_threshold)
-
-            # Loader efekti için süre ve başlangıç zamanı hesaplaması:
-            if add_loader:
-                # ➤➤➤➤ göstereceğiz, başlangıcı 2 saniye öne al
-                t_start_combined = max(0, verse_plain["start"] - 2)
-                loader_kf = 200  # 2 saniyelik efekt (kf birimi ~ 0.01s)
-            else:
-                t_start_combined = verse_plain["start"]
-                loader_kf = 0
-
-            # Plain metni oluştur (verse_plain'dan)
-            plain_text_parts = []
-
-            # "➤➤➤➤" üst satıra eklenecek
-            if loader_kf > 0:
-                plain_text_parts.append(f"{{\\kf{loader_kf}}}➤➤➤➤")
-
-            for word in verse_plain["words"]:
-                word_duration_cs = int((word["end"] - word["start"]) * 100)
-                plain_text_parts.append(f"{{\\kf{word_duration_cs}}}{word.get('raw', word['word'])}")
-            plain_text = f"{{\\fad(300,0)}}{' '.join(plain_text_parts)}"
-
-            # Karaoke efektli metni oluştur (verse_karaoke'dan)
-            karaoke_parts = []
-            
-            for word in verse_karaoke["words"]:
-                word_duration_cs = int((word["end"] - word["start"]) * 100)
-                karaoke_parts.append(f"{{\\kf{word_duration_cs}}}{word.get('raw', word['word'])}")
-            karaoke_text = f"{{\\fad(300,0)}}{' '.join(karaoke_parts)}"
-            
-            # Birleştirilmiş metin: Üst satırda plain metin, alt satırda karaoke efektli metin
-            combined_text = plain_text + "\\N" + karaoke_text
+            add_loader = pair_loader[i]
+        else:
+            # Tek verse göster (çünkü sonraki verse ile arasında 5 saniyeden fazla süre var veya son verse)
+            add_loader = loader_before[i]
 
-            # Event zamanlaması: başlama uygun şekilde ayarlandı, bitiş odd index'in end'i
-            combined_end = verse_karaoke["end"]
+        # ➤➤➤➤ göstereceksek başlangıcı 2 saniye öne al (kf birimi ~ 0.01s)
+        text_parts = []
+        if add_loader:
+            t_start = max(0, starts[i] - 2)
+            text_parts.append(_KF_FMT % (200, "➤➤➤➤"))
+        else:
+            t_start = starts[i]
+
+        text_parts.extend(_karaoke_word_parts(verses[i]["words"]))
+        text = _FAD_WRAP % ' '.join(text_parts)
 
-            write_dialogue(file, t_start_combined, combined_end, combined_text, style="Line2")
+        if pair_with_next[i]:
+            # Birleştirilmiş metin: Üst satırda plain metin, alt satırda karaoke efektli metin
+            karaoke_text = _FAD_WRAP % ' '.join(_karaoke_word_parts(verses[i + 1]["words"]))
+            lines.append(format_dialogue(t_start, ends[i + 1], text + "\\N" + karaoke_text, style="Line2"))
             i += 2
         else:
-            # Tek verse göster (çünkü sonraki verse ile arasında 5 saniyeden fazla süre var veya son verse)
-            verse = verses[i]
-            
-            # Bir sonraki verse ile arasında 5+ saniye var mı kontrol et (eğer mevcut değilse zaten tek gösterilecek)
-            next_verse_far = (i + 1 >= len(verses)) or (verses[i + 1]["start"] - verse["end"] >= loader_threshold)
-            
-            if i == 0:
-                add_loader = True
-            else:
-                prev_verse = verses[i - 1]
-                gap = verse["start"] - prev_verse["end"]
-                add_loader = (gap >= loader_threshold)
-            
-            # ➤➤➤➤ için başlangıç zamanını ayarla
-            if add_loader:
-                t_start = max(0, verse["start"] - 2)
-                loader_kf = 200  # 2 saniyelik efekt (kf birimi ~ 0.01s)
-            else:
-                t_start = verse["start"]
-                loader_kf = 0
-
-            text_parts = []
-            
-            # Sadece başlangıçta veya boşluk varsa ➤➤➤➤ ekle
-            if loader_kf > 0:
-                text_parts.append(f"{{\\kf{loader_kf}}}➤➤➤➤")
-                
-            for word in verse["words"]:
-                word_duration_cs = int((word["end"] - word["start"]) * 100)
-                text_parts.append(f"{{\\kf{word_duration_cs}}}{word.get('raw', word['word'])}")
-                
-            text = f"{{\\fad(300,0)}}{' '.join(text_parts)}"
-            
-            # Tek satır olduğunda ve bir sonraki verse uzaktaysa, metni daha aşağıda göster
-            position = "lower_center" if next_verse_far else "Line2"
-            
-            write_dialogue(file, t_start, verse["end"], text, style="Line2", position=position)
+            # Tek satır gösterildiğinde sonraki verse ya yoktur ya da uzaktadır
+            # (bu dal yalnızca o durumda çalışır); metni daha aşağıda göster
+            lines.append(format_dialogue(t_start, ends[i], text, style="Line2", position="lower_center"))
             i += 1
 
+    file.writelines(lines)
+
 
 def create_ass_file(
     verses_data: list,
@@ -535,47 +541,60 @@ def create_ass_file(
         print(f"Input verses_data length: {len(verses_data)}")
         print(f"Sample verse timing: start={(verses_data[0]['start'] if verses_data else 'N/A')}, end={(verses_data[0]['end'] if verses_data else 'N/A')}")
         
+        # Kelime metinleri bir kez normalize edilir (raw yoksa word)
+        normalize_word_texts(verses_data)
+
         available_colors = get_available_colors()
-        primary_color = validate_and_get_color(primary_color, "&H0000A5FF", available_colors)
-        secondary_color = validate_and_get_color(secondary_color, "&H00FFFFFF", available_colors)
-        outline_color = validate_and_get_color(outline_color, "&H00FF8080", available_colors)
-        shadow_color = validate_and_get_color(shadow_color, "&H00FF8080", available_colors)
-
-        with open(output_path, "w", encoding="utf-8") as file:
-            # Script Info
-            write_script_info(file, title=title, screen_width=screen_width, screen_height=screen_height)
-            # Styles
-            write_styles(
-                file,
-                font=font,
-                fontsize=fontsize,
-                primary_color=primary_color,
-                secondary_color=secondary_color,
-                outline_color=outline_color,
-                outline_size=outline_size,
-                shadow_color=shadow_color,
-                shadow_size=shadow_size,
-                screen_height=screen_height
+        primary_color, secondary_color, outline_color, shadow_color = (
+            validate_and_get_color(color, default_color, available_colors)
+            for color, default_color in (
+                (primary_color, "&H0000A5FF"),
+                (secondary_color, "&H00FFFFFF"),
+                (outline_color, "&H00FF8080"),
+                (shadow_color, "&H00FF8080"),
             )
-            # Events Header
-            write_section(file, "Events", "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text")
-            # Title
-            write_title_event(file, title, title_duration, screen_width, screen_height, fontsize=fontsize + 12)
+        )
+
+        # Tüm içerik önce bellekte oluşturulur, dosyaya tek seferde yazılır
+        file = io.StringIO()
+
+        # Script Info
+        write_script_info(file, title=title, screen_width=screen_width, screen_height=screen_height)
+        # Styles
+        write_styles(
+            file,
+            font=font,
+            fontsize=fontsize,
+            primary_color=primary_color,
+            secondary_color=secondary_color,
+            outline_color=outline_color,
+            outline_size=outline_size,
+            shadow_color=shadow_color,
+            shadow_size=shadow_size,
+            screen_height=screen_height
+        )
+        # Events Header
+        write_section(file, "Events", "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text")
+        # Title
+        write_title_event(file, title, title_duration, screen_width, screen_height, fontsize=fontsize + 12)
+
+        # 2 satırlı verse yapısı (mod kontrolü ile sırayla)
+        write_scrolling_lyrics_events(file, verses_data, screen_width, screen_height, fontsize=fontsize)
 
-            # 2 satırlı verse yapısı (mod kontrolü ile sırayla)
-            write_scrolling_lyrics_events(file, verses_data, screen_width, screen_height, fontsize=fontsize)
+        # Son satırı uzat veya değiştir
+        extend_last_event(file, verses_data, audio_duration)
 
-            # Son satırı uzat veya değiştir
-            extend_last_event(file, verses_data, audio_duration)
+        content = file.getvalue()
+        # Metin bir kez UTF-8'e çevrilir; ikili modda tek write çağrısıyla yazılır
+        data = content.encode("utf-8")
+        with open(output_path, "wb") as out_file:
+            out_file.write(data)
 
         print(f"ASS file successfully written to: {output_path}")
         try:
-            import os
-            file_size = os.path.getsize(output_path)
-            print(f"ASS file size: {file_size} bytes")
-            with open(output_path, "r", encoding="utf-8") as f:
-                sample_content = f.read(1000)
-                print(f"Sample ASS content (first 1000 chars): {sample_content[:1000]}...")
+            print(f"ASS file size: {len(data)} bytes")
+            # Örnek içerik dosyayı tekrar okumadan bellekteki metinden alınır
+            print(f"Sample ASS content (first 1000 chars): {content[:1000]}...")
         except Exception as e:
             print(f"Error getting ASS file stats: {e}")
 
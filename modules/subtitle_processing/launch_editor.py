@@ -4,7 +4,6 @@ from typing import Union, Optional
 import logging
 import webbrowser
 import tempfile
-import shutil
 import os
 import json
 
@@ -15,6 +14,24 @@ from ..utilities import ensure_directory_exists
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
+# Demo editörü için örnek ASS içeriği
+_DEMO_ASS_CONTENT = """[Script Info]
+Title: Example Karaoke
+ScriptType: v4.00+
+PlayResX: 1280
+PlayResY: 720
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+Style: Default,Arial,48,&H00FFFFFF,&H000000FF,&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,2,2,2,10,10,10,1
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:01.00,0:00:05.00,Default,,0,0,0,,Örnek Altyazı 1
+Dialogue: 0,0:00:06.00,0:00:10.00,Default,,0,0,0,,Örnek Altyazı 2
+Dialogue: 0,0:00:11.00,0:00:15.00,Default,,0,0,0,,Örnek Altyazı 3
+"""
+
 def launch_visual_ass_editor(working_dir: Optional[Union[str, Path]] = None):
     """
     Görsel ASS editörünü başlatır. Eğer working_dir verilmişse, o dizindeki
@@ -60,38 +77,21 @@ def _launch_demo_editor():
         project_root = current_path.parent.parent.parent
         static_path = project_root / "interface" / "static"
         
-        # Örnek ASS içeriği
-        example_ass = """[Script Info]
-Title: Example Karaoke
-ScriptType: v4.00+
-PlayResX: 1280
-PlayResY: 720
-
-[V4+ Styles]
-Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
-Style: Default,Arial,48,&H00FFFFFF,&H000000FF,&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,2,2,2,10,10,10,1
-
-[Events]
-Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
-Dialogue: 0,0:00:01.00,0:00:05.00,Default,,0,0,0,,Örnek Altyazı 1
-Dialogue: 0,0:00:06.00,0:00:10.00,Default,,0,0,0,,Örnek Altyazı 2
-Dialogue: 0,0:00:11.00,0:00:15.00,Default,,0,0,0,,Örnek Altyazı 3
-"""
-        
-        # Geçici dizinde dosya oluştur
-        temp_dir = tempfile.mkdtemp(prefix="karaoke_editor_demo_")
-        temp_ass_file = Path(temp_dir) / "example.ass"
-        
-        with open(temp_ass_file, "w", encoding="utf-8") as f:
-            f.write(example_ass)
-        
-        # Editörü başlat
-        result = edit_ass_with_visual_editor(temp_ass_file)
-        
-        # Geçici dosyaları temizle
-        shutil.rmtree(temp_dir, ignore_errors=True)
-        
-        return result
+        # Her açılışta örnek içerik yeni ve yalnızca bu sürece ait bir geçici dosyaya yazılır
+        # (önceki düzenlemeler ya da başka kullanıcıların dosyaları demoya taşınmaz)
+        fd, temp_ass_file = tempfile.mkstemp(prefix="karaoke_editor_demo_", suffix=".ass")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(_DEMO_ASS_CONTENT)
+            
+            # Editörü başlat
+            return edit_ass_with_visual_editor(temp_ass_file)
+        finally:
+            # Geçici dosyayı temizle
+            try:
+                os.remove(temp_ass_file)
+            except OSError:
+                pass
         
     except Exception as e:
         logger.error(f"Demo ASS editör başlatma hatası: {e}")
@@ -5,6 +5,7 @@ import logging
 import traceback
 import os
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Local Application Imports
 from .utilities import extract_audio_duration
@@ -39,11 +40,12 @@ def process_karaoke_subtitles(
         logger.info(f"Override: {override}")
         logger.info(f"Output file name: {file_name}")
 
-        metadata = Path(output_path) / "metadata.json"
-        modified_lyrics_file = Path(output_path) / "modified_lyrics.json"
-        raw_lyrics_file = Path(output_path) / "raw_lyrics.json"
-        audio_file = Path(output_path) / "karaoke_audio.mp3"
-        output_file = Path(output_path) / file_name
+        output_dir = Path(output_path)
+        metadata = output_dir / "metadata.json"
+        modified_lyrics_file = output_dir / "modified_lyrics.json"
+        raw_lyrics_file = output_dir / "raw_lyrics.json"
+        audio_file = output_dir / "karaoke_audio.mp3"
+        output_file = output_dir / file_name
 
         # ASS dosyası varsa sil
         if output_file.exists() and override:
@@ -54,7 +56,8 @@ def process_karaoke_subtitles(
                 logger.warning(f"Could not delete existing ASS file: {e}")
 
         # Mevcut modified_lyrics.json dosyası var mı kontrol et
-        if Path(modified_lyrics_file).exists():
+        modified_exists = modified_lyrics_file.exists()
+        if modified_exists:
             logger.info(f"Modified lyrics file exists at: {modified_lyrics_file}")
             # Dosyanın son güncellenme zamanını al
             try:
@@ -67,12 +70,12 @@ def process_karaoke_subtitles(
             logger.warning(f"Modified lyrics file does not exist at: {modified_lyrics_file}")
 
         # Force reload the lyrics data from disk
-        if Path(modified_lyrics_file).exists():
+        if modified_exists:
             logger.info("Modified lyrics file exists. Using it for subtitle generation.")
-            lyrics_file = Path(modified_lyrics_file)
+            lyrics_file = modified_lyrics_file
         else:
             logger.info("Modified lyrics file does not exist. Using raw lyrics file.")
-            lyrics_file = Path(raw_lyrics_file)
+            lyrics_file = raw_lyrics_file
             
         logger.info(f"Using lyrics file: {lyrics_file}")
 
@@ -80,24 +83,28 @@ def process_karaoke_subtitles(
             logger.error("Lyrics file does not exist. Skipping subtitle generation...")
             raise FileNotFoundError(f"Lyrics file '{lyrics_file}' does not exist.")
 
-        # Load the artist info
-        artist_info = load_json(metadata)
-        song_name = artist_info.get("title", "Unknown Title")
-        artist_name = artist_info.get("artists", ["Unknown Artist"])[0]
-        title = f"{artist_name}\n~ {song_name} ~\nKaraoke"
-        title = title.replace("\n", r"\N")
-
-        # Load the lyrics
-        verses_data = load_json(lyrics_file)
-        logger.info(f"Loaded {len(verses_data)} verses from {lyrics_file.name}")
-        
-        # Log some sample verse timing data
-        if verses_data and len(verses_data) > 0:
-            sample_verse = verses_data[0]
-            logger.info(f"Sample verse timing - start: {sample_verse.get('start')}, end: {sample_verse.get('end')}")
-
         # Extract audio duration (assuming you have an input file for the instrumental audio)
-        audio_duration = extract_audio_duration(audio_file)
+        # ffprobe arka planda çalışırken JSON dosyaları okunur
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            duration_future = executor.submit(extract_audio_duration, audio_file)
+
+            # Load the artist info
+            artist_info = load_json(metadata)
+            song_name = artist_info.get("title", "Unknown Title")
+            artist_name = artist_info.get("artists", ["Unknown Artist"])[0]
+            title = f"{artist_name}\n~ {song_name} ~\nKaraoke"
+            title = title.replace("\n", r"\N")
+
+            # Load the lyrics
+            verses_data = load_json(lyrics_file)
+            logger.info(f"Loaded {len(verses_data)} verses from {lyrics_file.name}")
+            
+            # Log some sample verse timing data
+            if verses_data and len(verses_data) > 0:
+                sample_verse = verses_data[0]
+                logger.info(f"Sample verse timing - start: {sample_verse.get('start')}, end: {sample_verse.get('end')}")
+
+            audio_duration = duration_future.result()
 
         if audio_duration is None:
             raise ValueError(f"Could not extract audio duration from {audio_file}")
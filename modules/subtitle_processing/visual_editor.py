@@ -1,38 +1,128 @@
 # Standard Library Imports
 from pathlib import Path
 from typing import Union, Optional
+import atexit
 import logging
 import os
-import tempfile
-import shutil
 import webbrowser
-import time
+import hashlib
 import http.server
-import socketserver
+import mimetypes
 import threading
+import time
 import urllib.parse
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
 
-# Basit HTTP sunucusu için handler
-class EditorHTTPHandler(http.server.SimpleHTTPRequestHandler):
+# Kullanıcıya düzenleme için tanınan süre (saniye)
+EDITOR_WAIT_SECONDS = 10
+EDITOR_WAIT_SECONDS_DOCKER = 30
+
+# Editör sunucusu varsayılan olarak yalnızca yerel makineden erişilebilir;
+# Docker'da dışarıdan erişim için EDITOR_BIND_HOST=0.0.0.0 ayarlanmalıdır
+EDITOR_BIND_HOST = os.environ.get("EDITOR_BIND_HOST", "127.0.0.1")
+
+# Uzun süre tarayıcı önbelleğinde tutulacak statik dosya uzantıları (HTML her seferinde doğrulanır)
+IMMUTABLE_ASSET_EXTENSIONS = {".js", ".css", ".woff2", ".png", ".svg", ".ico"}
+
+def load_static_entry(file_path: Path) -> tuple:
+    """
+    Tek bir statik dosyayı okur.
+
+    Returns:
+        tuple: (mtime_ns, data, content_type, etag)
+    """
+    mtime_ns = file_path.stat().st_mtime_ns
+    data = file_path.read_bytes()
+    content_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+    return mtime_ns, data, content_type, f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+
+def load_static_cache(static_path: Union[str, Path]) -> dict:
+    """
+    static_path altındaki tüm dosyaları belleğe yükler.
+
+    Returns:
+        dict: Göreli yol (ör. "subtitle_editor.html") -> (mtime_ns, data, content_type, etag)
+    """
+    static_path = Path(static_path)
+    return {
+        file_path.relative_to(static_path).as_posix(): load_static_entry(file_path)
+        for file_path in static_path.rglob("*")
+        if file_path.is_file()
+    }
+
+# Basit HTTP sunucusu için handler: statik dosyalar bellekteki önbellekten sunulur
+class EditorHTTPHandler(http.server.BaseHTTPRequestHandler):
+    # HTTP/1.1: tüm dosyalar tek bir keep-alive bağlantısı üzerinden sunulur
+    # (her yanıtta Content-Length gönderilir); boşta kalan bağlantılar 30 sn sonra kapanır
+    protocol_version = "HTTP/1.1"
+    timeout = 30
+
     def __init__(self, *args, **kwargs):
-        self.editor_base_path = kwargs.pop('editor_base_path', '')
+        self.static_cache = kwargs.pop('static_cache', {})
+        self.static_path = kwargs.pop('static_path', None)
         super().__init__(*args, **kwargs)
 
-    def do_GET(self):
+    def _get_cached(self, name: str):
+        """
+        Önbellekteki dosyayı döndürür; diskteki mtime değiştiyse dosyayı yeniden okur
+        (düzenlenen statik dosyalar yeni ETag ile sunulur).
+        """
+        entry = self.static_cache.get(name)
+        if entry is None or self.static_path is None:
+            return entry
+
+        file_path = self.static_path / name
+        try:
+            if file_path.stat().st_mtime_ns != entry[0]:
+                entry = load_static_entry(file_path)
+                self.static_cache[name] = entry
+        except OSError:
+            # Dosya silindiyse artık sunulmaz
+            self.static_cache.pop(name, None)
+            return None
+        return entry
+
+    def _send_cached(self, include_body: bool):
         parsed_path = urllib.parse.urlparse(self.path)
-        if parsed_path.path == '/':
-            self.path = '/subtitle_editor.html'
-        
-        # Yolu editor_base_path'e göre oluştur
-        if self.editor_base_path:
-            full_path = os.path.join(self.editor_base_path, self.path.lstrip('/'))
-            if os.path.exists(full_path):
-                self.path = full_path
-        
-        return http.server.SimpleHTTPRequestHandler.do_GET(self)
+        name = urllib.parse.unquote(parsed_path.path).lstrip('/') or "subtitle_editor.html"
+
+        entry = self._get_cached(name)
+        if entry is None:
+            # Önbellekte olmayan dosyalar için diske inilmez
+            self.send_error(404, "File not found")
+            return
+
+        _, data, content_type, etag = entry
+        cache_control = (
+            "public, max-age=31536000, immutable"
+            if os.path.splitext(name)[1].lower() in IMMUTABLE_ASSET_EXTENSIONS
+            else "no-cache"
+        )
+
+        # Tarayıcıdaki kopya güncelse gövde gönderilmez
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache_control)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        self.end_headers()
+        if include_body:
+            self.wfile.write(data)
+
+    def do_GET(self):
+        self._send_cached(include_body=True)
+
+    def do_HEAD(self):
+        self._send_cached(include_body=False)
 
     def log_message(self, format, *args):
         # HTTP sunucu günlüklerini devre dışı bırak
@@ -54,7 +144,7 @@ class AssVisualEditor:
         self.port = port
         self.server = None
         self.server_thread = None
-        self.temp_dir = None
+        self._static_cache = {}
         
     def _start_server(self):
         """
@@ -65,20 +155,23 @@ class AssVisualEditor:
             if self.server:
                 self.stop_server()
             
-            # Geçici dizin oluştur
-            self.temp_dir = tempfile.mkdtemp(prefix="karaoke_editor_")
-            
-            # Statik dosyaları geçici dizine kopyala
+            # Statik dosyalar doğrudan static_path'ten sunulur
             editor_html = self.static_path / "subtitle_editor.html"
-            if editor_html.exists():
-                shutil.copy(editor_html, self.temp_dir)
-            else:
+            if not editor_html.exists():
                 logger.error(f"Editor HTML dosyası bulunamadı: {editor_html}")
                 return False
             
+            # Statik dosyalar sunucu başlarken bir kez belleğe alınır
+            self._static_cache = load_static_cache(self.static_path)
+            
             # HTTP sunucusunu başlat
-            handler = lambda *args, **kwargs: EditorHTTPHandler(*args, editor_base_path=str(self.static_path), **kwargs)
-            self.server = socketserver.TCPServer(("0.0.0.0", self.port), handler)
+            handler = lambda *args, **kwargs: EditorHTTPHandler(
+                *args, static_cache=self._static_cache, static_path=self.static_path, **kwargs
+            )
+            # Tarayıcının paralel istekleri ayrı thread'lerde karşılanır
+            self.server = http.server.ThreadingHTTPServer((EDITOR_BIND_HOST, self.port), handler)
+            self.server.daemon_threads = True
+            self.server.karaoke_editor = self
             
             # Sunucuyu ayrı bir thread'da başlat
             self.server_thread = threading.Thread(target=self.server.serve_forever)
@@ -101,11 +194,6 @@ class AssVisualEditor:
             self.server.server_close()
             self.server = None
             self.server_thread = None
-            
-            # Geçici dizini temizle
-            if self.temp_dir and os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
-                self.temp_dir = None
                 
             logger.info("ASS editör sunucusu durduruldu")
     
@@ -140,14 +228,12 @@ class AssVisualEditor:
             print("ASS altyazı düzenleyici tarayıcıda açıldı.")
             print("Düzenlemelerinizi yapın ve 'Değişiklikleri Kaydet' düğmesine tıklayın.")
             print("Düzenlemek üzere olan dosya:", ass_file_path)
-            print("Düzenlemeyi tamamladıktan sonra 10 saniye bekleyin...")
+            print(f"Düzenlemeyi tamamladıktan sonra {EDITOR_WAIT_SECONDS} saniye bekleyin...")
             print("=======================================\n")
             
-            # Kullanıcıya düzenleme yapmak için zaman tanı (Docker'da input() yerine time.sleep())
-            time.sleep(10)
-            
-            # Düzenleyici kapatıldıktan sonra sunucuyu durdur
-            self.stop_server()
+            # Kullanıcıya düzenleme yapmak için zaman tanı.
+            # Sunucu açık kalır; bir sonraki düzenleme aynı sunucuyu kullanır.
+            time.sleep(EDITOR_WAIT_SECONDS)
             
             return True
             
@@ -156,6 +242,29 @@ class AssVisualEditor:
             self.stop_server()
             return False
 
+# Süreç boyunca tek bir editör sunucusu kullanılır (her dosya için bind/listen yapılmaz)
+_EDITOR_SINGLETON: Optional[AssVisualEditor] = None
+_EDITOR_LOCK = threading.Lock()
+
+def _get_editor() -> Optional[AssVisualEditor]:
+    """
+    Paylaşılan editörü döndürür; sunucusu çalışmıyorsa başlatır.
+    Sunucu süreç kapanırken atexit ile durdurulur.
+    
+    Returns:
+        Optional[AssVisualEditor]: Sunucu başlatılamazsa None
+    """
+    global _EDITOR_SINGLETON
+    with _EDITOR_LOCK:
+        if _EDITOR_SINGLETON is None:
+            # Projenin root dizinini bul
+            project_root = Path(__file__).resolve().parent.parent.parent
+            _EDITOR_SINGLETON = AssVisualEditor(static_path=project_root / "interface" / "static")
+            atexit.register(_EDITOR_SINGLETON.stop_server)
+        if not _EDITOR_SINGLETON.server and not _EDITOR_SINGLETON._start_server():
+            return None
+        return _EDITOR_SINGLETON
+
 # Tek bir istemci için kullanım örneği
 def edit_ass_with_visual_editor(ass_file_path: Union[str, Path], mp3_file_path: Optional[Union[str, Path]] = None) -> bool:
     """
@@ -169,12 +278,9 @@ def edit_ass_with_visual_editor(ass_file_path: Union[str, Path], mp3_file_path:
         bool: Düzenleme başarılı ise True, değilse False
     """
     try:
-        # Projenin root dizinini bul
-        current_path = Path(__file__).resolve()
-        project_root = current_path.parent.parent.parent
-        static_path = project_root / "interface" / "static"
-        
-        editor = AssVisualEditor(static_path=static_path)
+        editor = _get_editor()
+        if editor is None:
+            return False
         
         # Docker ortamında çalışıp çalışmadığımızı kontrol etmek için bir ortam değişkeni kontrolü yap
         docker_env = os.environ.get('SYSTEM', '').lower() == 'spaces'
@@ -184,13 +290,9 @@ def edit_ass_with_visual_editor(ass_file_path: Union[str, Path], mp3_file_path:
             print("\n=======================================")
             print("ASS altyazı editörü açılıyor (Docker ortamı)...")
             print("Tarayıcı penceresi açılacak ve editör yüklenecek.")
-            print("Düzenlemeyi tamamladıktan sonra 10 saniye bekleyin.")
+            print(f"Düzenlemeyi tamamladıktan sonra {EDITOR_WAIT_SECONDS_DOCKER} saniye bekleyin.")
             print("=======================================")
             
-            # Sunucuyu başlat
-            if not editor._start_server():
-                return False
-                
             # Docker ortamında, host ismini al
             docker_ip = os.environ.get('GRADIO_SERVER_NAME', '0.0.0.0')  # Docker Cloud'da IP olarak Gradio server nameı kullan
             url = f"http://{docker_ip}:{editor.port}"
@@ -201,15 +303,18 @@ def edit_ass_with_visual_editor(ass_file_path: Union[str, Path], mp3_file_path:
             
             print(f"Editör URL: {url}")
             
+            # Sunucu loopback'e bağlıysa konteyner dışından erişilemez
+            if EDITOR_BIND_HOST in ("127.0.0.1", "localhost", "::1"):
+                print("\n\u26a0️ Editör sunucusu yalnızca konteyner içinden erişilebilir "
+                      f"({EDITOR_BIND_HOST}). Dışarıdan açmak için EDITOR_BIND_HOST=0.0.0.0 ayarlayın "
+                      f"ve {editor.port} portunu yayınlayın.")
+            
             # Uyarı göster
             print("\n\u26a0️ Docker ortamında çalışıldığında, lütfen web tarayıcınızda yukarıdaki URL'yi manuel olarak açın.")
-            print("Düzenlemeyi tamamladıktan sonra bekleyiniz, 30 saniye sonra otomatik olarak kapanacaktır.")
-            
-            # Bekle
-            time.sleep(30)  # Docker için daha uzun bir süre bekle
+            print(f"Düzenlemeyi tamamladıktan sonra bekleyiniz, {EDITOR_WAIT_SECONDS_DOCKER} saniye sonra otomatik olarak kapanacaktır.")
             
-            # Sunucuyu durdur
-            editor.stop_server()
+            # Bekle (sunucu açık kalır)
+            time.sleep(EDITOR_WAIT_SECONDS_DOCKER)
             return True
         else:
             # Normal ortamda çalışıyoruz, normal yöntemi kullan
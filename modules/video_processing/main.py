@@ -1,28 +1,44 @@
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Optional, Tuple
 import subprocess
+import os
 import logging
-import torch
+import threading
+import time
+from collections import deque
 
 from .utilities import extract_audio_duration, validate_file
 
 logger = logging.getLogger(__name__)
 
-def parse_ass_time(time_str: str) -> float:
+# FFmpeg ilerleme izleme ayarları
+FFMPEG_PROGRESS_LOG_INTERVAL = 2.0  # saniye; ilerleme satırlarının loglanma aralığı
+FFMPEG_STALL_TIMEOUT = 60.0  # saniye; kare sayısı bu süre boyunca artmazsa FFmpeg durdurulur
+FFMPEG_STDERR_TAIL = 20  # hata durumunda loglanacak son stderr satırı sayısı
+
+# NVENC, x264 ön ayar adlarından yalnızca bunları tanır; diğerleri "fast"a eşlenir
+NVENC_PRESETS = {"slow", "medium", "fast"}
+
+# ASS zaman damgası (H:MM:SS.cc); str ve bayt girdiler için ayrı derlenmiş desenler.
+# Alanın tamamı eşleşmelidir (fullmatch): sonda fazladan karakter olan zamanlar reddedilir;
+# her bileşen önceki float() ayrıştırmasındaki gibi işaretli ondalık sayı olabilir
+_ASS_TIME_NUM = r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)"
+_ASS_TIME_RE = re.compile(rf"\s*({_ASS_TIME_NUM}):({_ASS_TIME_NUM}):({_ASS_TIME_NUM})\s*")
+_ASS_TIME_RE_BYTES = re.compile(_ASS_TIME_RE.pattern.encode("ascii"))
+
+def parse_ass_time(time_str: Union[str, bytes]) -> float:
     """
     ASS zaman formatını (örn. "0:00:04.00") saniyeye çevirir.
+    Bayt girdiler (ör. ikili okunan ASS satırları) doğrudan kabul edilir.
     """
-    try:
-        parts = time_str.strip().split(":")
-        if len(parts) == 3:
-            hours = float(parts[0])
-            minutes = float(parts[1])
-            seconds = float(parts[2])
-            return hours * 3600 + minutes * 60 + seconds
-    except Exception as e:
-        logger.error(f"Time parse error for '{time_str}': {e}")
-    return 0.0
+    pattern = _ASS_TIME_RE_BYTES if isinstance(time_str, bytes) else _ASS_TIME_RE
+    m = pattern.fullmatch(time_str)
+    if m is None:
+        logger.error(f"Time parse error for '{time_str}'")
+        return 0.0
+    return float(m[1]) * 3600 + float(m[2]) * 60 + float(m[3])
 
 def parse_countdown_times(ass_path: Union[str, Path]) -> Optional[Tuple[float, float]]:
     """
@@ -33,36 +49,82 @@ def parse_countdown_times(ass_path: Union[str, Path]) -> Optional[Tuple[float, f
     """
     first_end = None
     second_start = None
+    _parse = parse_ass_time
     try:
-        with open(ass_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("Dialogue:"):
-                    parts = line.split(",", 9)
-                    if len(parts) < 10:
-                        continue
-                    start_time = parse_ass_time(parts[1])
-                    end_time = parse_ass_time(parts[2])
-                    if first_end is None:
-                        first_end = end_time
-                    else:
-                        second_start = start_time
-                        break
+        # Satırlar bayt olarak okunur; zaman alanları decode edilmeden ayrıştırılır
+        with open(ass_path, "rb") as f:
+            for raw in f:
+                if raw[:9] != b"Dialogue:":
+                    continue
+                # Sadece Start/End gerekli: ilk üç virgülden sonra bölmeyi bırak,
+                # kalan kısımda geçerli bir Dialogue satırının 6 virgülü olmalı
+                parts = raw.split(b",", 3)
+                if len(parts) < 4 or parts[3].count(b",") < 6:
+                    continue
+                if first_end is None:
+                    first_end = _parse(parts[2])
+                else:
+                    second_start = _parse(parts[1])
+                    break
         if first_end is not None and second_start is not None and second_start > first_end:
             return (first_end, second_start)
     except Exception as e:
         logger.error(f"Failed to parse countdown times from {ass_path}: {e}")
     return None
 
+# Logo overlay dosyası; yalnızca dekoratif olduğundan yoksa overlay atlanır.
+# Varlığı modül yüklenirken bir kez kontrol edilir.
+LOGO_PATH = Path("/app/public/osslogo.png")
+LOGO_EXISTS = LOGO_PATH.is_file()
+
+# Doğrulanmış sabit girdiler (arka plan, geri sayım, logo); yalnızca olumlu sonuçlar saklanır,
+# böylece sonradan eklenen dosyalar bir sonraki çağrıda yine diskte aranır
+_VALIDATED_ASSETS = set()
+
+def _validate_asset(path: Union[str, Path]) -> bool:
+    """
+    Şarkılar arasında değişmeyen girdi dosyalarını doğrular; bir kez bulunan
+    dosya için sonraki çağrılarda stat yapılmaz.
+    """
+    key = str(path)
+    if key in _VALIDATED_ASSETS:
+        return True
+    if not validate_file(key):
+        return False
+    _VALIDATED_ASSETS.add(key)
+    return True
+
+@lru_cache(maxsize=1)
+def _video_codec() -> Tuple[str, bool]:
+    """
+    Kullanılacak video codec'ini ve CRF desteğini döner: GPU varsa NVENC, yoksa libx264.
+    CUDA sorgusu işlem başına bir kez yapılır; torch da yalnızca burada yüklenir.
+    """
+    import torch
+
+    if torch.cuda.is_available():
+        device_name = torch.cuda.get_device_name(0)
+        logger.info(f"GPU found: {device_name} (NVENC).")
+        return "h264_nvenc", False
+    logger.warning("No GPU found, using libx264 (CPU).")
+    return "libx264", True
+
+@lru_cache(maxsize=16)
+def _countdown_pattern(countdown: int) -> re.Pattern:
+    """'gerisayım {countdown}.mov' dosya adı deseni (süre başına bir kez derlenir)."""
+    return re.compile(r"gerisay.?m\s*{}\.mov$".format(countdown), re.IGNORECASE)
+
 def find_countdown_video(directory: Union[str, Path], countdown: int) -> Optional[str]:
     """
     Belirtilen dizinde, 'gerisayım {countdown}.mov' formatına uygun dosyayı arar.
     Uygun dosya bulunursa yolunu döndürür, aksi halde None.
     """
-    dir_path = Path(directory)
-    pattern = re.compile(r"gerisay.?m\s*{}\.(mov)$".format(countdown), re.IGNORECASE)
-    for file in dir_path.iterdir():
-        if file.is_file() and pattern.search(file.name):
-            return str(file)
+    pattern = _countdown_pattern(countdown)
+    # scandir girdileri dosya türünü readdir sonucundan verir (ek stat çağrısı yok)
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and pattern.search(entry.name):
+                return entry.path
     return None
 
 def select_countdown_video(directory: Union[str, Path], duration: float) -> Optional[str]:
@@ -78,6 +140,78 @@ def select_countdown_video(directory: Union[str, Path], duration: float) -> Opti
         logger.warning(f"No countdown video found for duration: {duration}")
     return video_path
 
+def run_ffmpeg(cmd: list) -> None:
+    """
+    FFmpeg komutunu çalıştırır; `-progress pipe:1` çıktısını ayrı bir thread'de
+    okuyup periyodik olarak loglar ve kare sayısı FFMPEG_STALL_TIMEOUT boyunca
+    ilerlemezse süreci sonlandırır.
+
+    Raises:
+        subprocess.CalledProcessError: FFmpeg sıfırdan farklı kodla çıkarsa
+            (stderr'in son satırları `stderr` alanında bulunur)
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+    stderr_tail = deque(maxlen=FFMPEG_STDERR_TAIL)
+    last_frame = {"value": None, "changed_at": time.monotonic()}
+
+    def _read_progress():
+        progress = {}
+        last_log = 0.0
+        for line in process.stdout:
+            key, sep, value = line.strip().partition("=")
+            if not sep:
+                continue
+            progress[key] = value
+            if key == "frame" and value != last_frame["value"]:
+                last_frame["value"] = value
+                last_frame["changed_at"] = time.monotonic()
+            elif key == "progress":
+                # Her ilerleme bloğu "progress=continue|end" ile biter
+                now = time.monotonic()
+                if now - last_log >= FFMPEG_PROGRESS_LOG_INTERVAL or value == "end":
+                    logger.info(
+                        f"FFmpeg progress: frame={progress.get('frame')} "
+                        f"time={progress.get('out_time')} speed={progress.get('speed')}"
+                    )
+                    last_log = now
+
+    def _read_stderr():
+        for line in process.stderr:
+            stderr_tail.append(line.rstrip())
+
+    readers = [
+        threading.Thread(target=_read_progress, daemon=True),
+        threading.Thread(target=_read_stderr, daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    while True:
+        try:
+            returncode = process.wait(timeout=1.0)
+            break
+        except subprocess.TimeoutExpired:
+            if time.monotonic() - last_frame["changed_at"] > FFMPEG_STALL_TIMEOUT:
+                logger.error(f"FFmpeg made no progress for {FFMPEG_STALL_TIMEOUT:.0f}s, terminating.")
+                process.kill()
+                returncode = process.wait()
+                break
+
+    for reader in readers:
+        reader.join()
+
+    if returncode != 0:
+        stderr_text = "\n".join(stderr_tail)
+        logger.error(f"FFmpeg exited with code {returncode}. Last output:\n{stderr_text}")
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr_text)
+
 def generate_karaoke_video(
     audio_path: Union[str, Path],
     ass_path: Union[str, Path],
@@ -86,7 +220,7 @@ def generate_karaoke_video(
     background_rest: Optional[Union[str, Path]] = "/app/effects/background.mp4",
     countdown_video: Optional[Union[str, Path]] = None,
     resolution: str = "1280x720",
-    preset: str = "fast",
+    preset: str = "veryfast",
     crf: Optional[int] = 23,
     fps: int = 24,
     bitrate: str = "3000k",
@@ -104,7 +238,10 @@ def generate_karaoke_video(
       4) Eğer countdown_video mevcutsa, countdown overlay;
          overlay, ASS dosyasındaki first_end ile second_start aralığında (enable='between(t,first_end,second_start)')
          görünür olacak şekilde, [2:v] üzerinden setpts ile eklenir.
-      5) En son, ASS altyazıları eklenir, logo overlay yapılır, audio eklenir ve final video output_path'e yazılır.
+      5) En son, ASS altyazıları eklenir, logo overlay yapılır (logo dosyası varsa), audio eklenir ve final video output_path'e yazılır.
+
+    CPU (libx264) kodlamasında varsayılan ön ayar "veryfast"tır; daha yüksek kalite için
+    preset="fast" veya "medium" verilebilir. NVENC'in tanımadığı ön ayarlar "fast"a eşlenir.
     """
     # Dosya doğrulamaları
     if not validate_file(audio_path):
@@ -132,16 +269,23 @@ def generate_karaoke_video(
         elif countdown_video is None:
             countdown_video = select_countdown_video("/app/gerisayim", cd_duration)
 
-    # GPU kontrolü
-    if torch.cuda.is_available():
-        device_name = torch.cuda.get_device_name(0)
-        logger.info(f"GPU found: {device_name} (NVENC).")
-        video_codec = "h264_nvenc"
-        use_crf = False
-    else:
-        logger.warning("No GPU found, using libx264 (CPU).")
-        video_codec = "libx264"
-        use_crf = True
+    # Gerekli tüm girdi dosyaları FFmpeg komutu kurulmadan (ve ffprobe çalışmadan) önce doğrulanır
+    required_assets = []
+    if background_rest is not None:
+        required_assets.append((video_effect, "Background-first video (video_effect) is invalid"))
+        required_assets.append((background_rest, "Background_rest video is invalid"))
+    elif video_effect is not None:
+        required_assets.append((video_effect, "Video_effect is invalid"))
+    if countdown_video is not None:
+        required_assets.append((countdown_video, "Countdown video is invalid"))
+
+    for asset_path, error_message in required_assets:
+        if not _validate_asset(asset_path):
+            logger.error(f"{error_message}: {asset_path}")
+            return None
+
+    # GPU kontrolü (işlem başına bir kez)
+    video_codec, use_crf = _video_codec()
 
     audio_dur = extract_audio_duration(audio_path)
     if audio_dur is None:
@@ -149,51 +293,44 @@ def generate_karaoke_video(
         return None
 
     # FFmpeg komutunu oluşturuyoruz.
-    cmd = ["ffmpeg", "-y"]
+    cmd = ["ffmpeg", "-y", "-progress", "pipe:1", "-nostats"]
+    # Eklenen girdiler sırayla kaydedilir; filtrelerdeki indeksler buradan gelir.
+    inputs = []
+
+    def add_input(name: str, *args: str) -> int:
+        cmd.extend(args)
+        inputs.append(name)
+        return len(inputs) - 1
 
     # İki farklı background kullanılıyor: Eğer ASS zaman bilgileri varsa ve background_rest geçerliyse iki background kullanılacak.
     if background_rest is not None:
-        if not validate_file(video_effect):
-            logger.error(f"Background-first video (video_effect) is invalid: {video_effect}")
-            return None
-        if not validate_file(background_rest):
-            logger.error(f"Background_rest video is invalid: {background_rest}")
-            return None
-        # Input 0: background-first
-        cmd.extend(["-i", str(video_effect)])
+        # background-first
+        bg_index = add_input("background_first", "-i", str(video_effect))
     else:
         # Tek background: video_effect ya da renkli arka plan
         if video_effect is not None:
-            if not validate_file(video_effect):
-                logger.error(f"Video_effect is invalid: {video_effect}")
-                return None
-            cmd.extend(["-stream_loop", "-1", "-i", str(video_effect)])
+            bg_index = add_input("background", "-stream_loop", "-1", "-i", str(video_effect))
         else:
-            cmd.extend(["-f", "lavfi", "-i", f"color=c=black:s={resolution}:d={audio_dur}"])
+            bg_index = add_input("background", "-f", "lavfi", "-i", f"color=c=black:s={resolution}:d={audio_dur}")
     
-    # Input 1: audio
-    cmd.extend(["-i", str(audio_path)])
+    # Audio
+    audio_index = add_input("audio", "-i", str(audio_path))
     
-    # Input 2: countdown video (varsa, loop olmadan)
+    # Countdown video (varsa, loop olmadan)
     if countdown_video is not None:
-        if not validate_file(countdown_video):
-            logger.error(f"Countdown video is invalid: {countdown_video}")
-            return None
-        cmd.extend(["-i", str(countdown_video)])
+        countdown_index = add_input("countdown", "-i", str(countdown_video))
     
     # Eğer iki background kullanılacaksa, background_rest'i ekleyelim.
     if background_rest is not None:
-        cmd.extend(["-i", str(background_rest)])
-        # Input sırası: 0: background-first, 1: audio, 2: countdown, 3: background_rest.
-        bg_rest_index = "3"
-    else:
-        bg_rest_index = None
+        bg_rest_index = add_input("background_rest", "-i", str(background_rest))
 
     width, height = resolution.split("x")
     # Eğer ASS zaman bilgileri varsa ve iki background kullanılacaksa, split işlemi yapılır.
+    # Filtre grafiği parçalar halinde toplanır ve sonda tek seferde birleştirilir.
+    filter_parts = []
     if times is not None and background_rest is not None:
-        filter_chain = (
-            f"[0:v]trim=duration={second_start},setpts=PTS-STARTPTS,"
+        filter_parts.append(
+            f"[{bg_index}:v]trim=duration={second_start},setpts=PTS-STARTPTS,"
             f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
             f"pad=w={width}:h={height}:x='(ow-iw)/2':y='(oh-ih)/2'[bg1];"
             f"[{bg_rest_index}:v]trim=duration={audio_dur - second_start},setpts=PTS-STARTPTS,"
@@ -203,50 +340,51 @@ def generate_karaoke_video(
         )
     else:
         # Tek background kullanılıyor.
-        filter_chain = (
-            f"[0:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+        filter_parts.append(
+            f"[{bg_index}:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
             f"pad=w={width}:h={height}:x='(ow-iw)/2':y='(oh-ih)/2'[bg]"
         )
     
     # Altyazıları background üzerine ekle.
-    filter_chain += f"; [bg]subtitles={ass_path}:fontsdir=/app/fonts[vsub_bg]"
+    filter_parts.append(f"[bg]subtitles={ass_path}:fontsdir=/app/fonts[vsub_bg]")
     
     # Countdown overlay: Eğer countdown_video mevcutsa ve ASS zaman bilgileri varsa overlay ekle.
     if countdown_video is not None and times is not None:
-        filter_chain += (
-            "; [2:v]setpts=PTS+{offset}/TB,scale=300:240[countdown];"
-            " [vsub_bg][countdown]overlay=530:4:enable='between(t,{start},{end})'[vsub]"
-            .format(offset=first_end, start=first_end, end=second_start)
-        )
+        filter_parts.append(f"[{countdown_index}:v]setpts=PTS+{first_end}/TB,scale=300:240[countdown]")
+        filter_parts.append(f"[vsub_bg][countdown]overlay=530:4:enable='between(t,{first_end},{second_start})'[vsub]")
     else:
-        filter_chain += "; [vsub_bg]copy[vsub]"
+        filter_parts.append("[vsub_bg]copy[vsub]")
 
     # Logo overlay: osslogo.png 4 saniye boyunca ekranda görünsün, 4. saniyeden sonra aniden kaybolsun.
-    logo_path = "/app/public/osslogo.png"
-    if not validate_file(logo_path):
-        logger.error(f"Logo file is invalid: {logo_path}")
-        return None
-    cmd.extend(["-i", logo_path])
-    # Logo input'un index'i; cmd'deki tüm "-i" seçeneklerini sayarak hesaplıyoruz.
-    logo_index = len([arg for arg in cmd if arg == "-i"]) - 1
+    if LOGO_EXISTS:
+        logo_index = add_input("logo", "-i", LOGO_PATH.as_posix())
+        filter_parts.append(f"[{logo_index}:v]scale=160:180[logo_scaled]")
+        filter_parts.append("[vsub][logo_scaled]overlay=48:337:enable='lt(t,4)'[vfinal]")
+        final_video_stream = "[vfinal]"
+    else:
+        # Logo yoksa girdi ve overlay filtresi hiç eklenmez
+        logger.info(f"Logo file not found, skipping logo overlay: {LOGO_PATH}")
+        final_video_stream = "[vsub]"
 
-    filter_chain += (
-        f"; [{logo_index}:v]scale=160:180[logo_scaled]"
-        "; [vsub][logo_scaled]overlay=48:337:enable='lt(t,4)'[vfinal]"
-    )
-    final_video_stream = "[vfinal]"
+    filter_chain = "; ".join(filter_parts)
 
     cmd.extend([
         "-filter_complex", filter_chain,
         "-map", final_video_stream,
-        "-map", "1:a"
+        "-map", f"{audio_index}:a"
     ])
 
+    if video_codec == "h264_nvenc" and preset not in NVENC_PRESETS:
+        preset = "fast"
+
     cmd.extend([
         "-pix_fmt", "yuv420p",
         "-c:v", video_codec,
         "-preset", preset
     ])
+    if video_codec == "libx264":
+        # Tüm çekirdekleri kullan (kodlama CPU'ya bağlı)
+        cmd.extend(["-threads", "0"])
     if use_crf and crf is not None:
         cmd.extend(["-crf", str(crf)])
     cmd.extend([
@@ -260,7 +398,7 @@ def generate_karaoke_video(
 
     logger.debug("FFmpeg command: %s", " ".join(cmd))
     try:
-        subprocess.run(cmd, check=True)
+        run_ffmpeg(cmd)
         logger.info(f"Karaoke video created at: {output_path}")
         return str(output_path)
     except subprocess.CalledProcessError as e:
@@ -22,7 +22,7 @@ def process_karaoke_video(
     output_path: Union[str, Path],
     effect_path: Optional[Union[str, Path]],
     resolution: str = "1280x720",
-    preset: str = "fast",
+    preset: str = "veryfast",
     crf: int = 23,
     fps: int = 24,
     bitrate: str = "3000k",
@@ -61,11 +61,17 @@ def process_karaoke_video(
             else:
                 logger.warning("ASS dosyası düzenlenemedi. Orijinal dosya kullanılarak devam ediliyor.")
 
+        # FFmpeg'e verilecek yollar bir kez string'e çevrilir
+        audio_str = karaoke_audio.as_posix()
+        subtitles_str = relative_subtitles.as_posix()
+        output_str = relative_output.as_posix()
+        effect_str = effect_path.as_posix() if effect_path is not None else None
+
         generate_karaoke_video(
-            audio_path=karaoke_audio.as_posix(),
-            ass_path=relative_subtitles.as_posix(),
-            output_path=relative_output.as_posix(),
-            video_effect=effect_path.as_posix() if effect_path is not None else None,
+            audio_path=audio_str,
+            ass_path=subtitles_str,
+            output_path=output_str,
+            video_effect=effect_str,
             resolution=resolution,
             preset=preset,
             crf=crf,